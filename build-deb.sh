@@ -65,7 +65,7 @@ Version: $APP_VERSION
 Section: utils
 Priority: optional
 Architecture: amd64
-Depends: python3 (>= 3.8), python3-pip, python3-pyqt5, python3-pyscard, python3-pyperclip, pcscd, libpcsclite1
+Depends: python3 (>= 3.8), python3-pip, python3-pyqt5, python3-pyscard, pcscd, libpcsclite1
 Maintainer: Daniel Rosehill
 Description: NFC Reader/Writer GUI for ACS ACR1252
  A modern PyQt5-based GUI application for reading and writing NFC tags
@@ -117,7 +117,6 @@ EOF
         --hidden-import="smartcard.System" \
         --hidden-import="smartcard.CardMonitoring" \
         --hidden-import="smartcard.CardConnection" \
-        --hidden-import="pyperclip" \
         build/run_nfc_gui.py
 
     print_success "Executable built: dist/$APP_NAME"
@@ -143,7 +142,7 @@ Version: $APP_VERSION
 Section: utils
 Priority: optional
 Architecture: amd64
-Depends: python3 (>= 3.8), python3-pip, python3-pyqt5, python3-pyscard, python3-pyperclip, pcscd, libpcsclite1
+Depends: python3 (>= 3.8), python3-pip, python3-pyqt5, python3-pyscard, pcscd, libpcsclite1
 Maintainer: $AUTHOR
 Description: $DESCRIPTION
  A modern PyQt5-based GUI application for reading and writing NFC tags
@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('nfc_gui', 'nfc_gui')],
-    hiddenimports=['PyQt5.QtWidgets', 'PyQt5.QtCore', 'PyQt5.QtGui', 'smartcard', 'smartcard.System', 'smartcard.CardMonitoring', 'smartcard.CardConnection', 'pyperclip'],
+    hiddenimports=['PyQt5.QtWidgets', 'PyQt5.QtCore', 'PyQt5.QtGui', 'smartcard', 'smartcard.System', 'smartcard.CardMonitoring', 'smartcard.CardConnection'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
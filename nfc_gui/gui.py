@@ -4,7 +4,10 @@ NFC GUI Application - PyQt5-based GUI for NFC tag reading/writing
 Based on ACS ACR1252 USB NFC Reader/Writer
 """
 
+import re
 import sys
+from contextlib import ExitStack
+from functools import wraps
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -13,7 +16,7 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QLineEdit,
     QCheckBox,
     QRadioButton,
@@ -24,17 +27,652 @@ from PyQt5.QtWidgets import (
     QFrame,
     QProgressBar,
     QSystemTrayIcon,
-    QMenu,
-    QAction,
     QShortcut,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, pyqtSlot
-from PyQt5.QtGui import QFont, QIcon, QPixmap, QKeySequence
-import pyperclip
+from PyQt5.QtCore import (
+    Qt,
+    QThread,
+    QTimer,
+    QSignalBlocker,
+    pyqtSignal,
+    QObject,
+    pyqtSlot,
+    QRunnable,
+    QThreadPool,
+    QUrl,
+    QMetaObject,
+)
+from PyQt5.QtGui import (
+    QFont,
+    QIcon,
+    QPixmap,
+    QKeySequence,
+    QPalette,
+    QColor,
+    QPainter,
+    QDesktopServices,
+)
+import ctypes
 import subprocess
+import shutil
 import os
 from .nfc_handler import NFCHandler
-from .settings import Settings
+from .settings import (
+    Settings,
+    compile_pattern,
+    literal_prefix,
+    match_item_id,
+    normalize_target_base,
+)
+
+
+# Single application stylesheet, installed once by main(); widgets opt in
+# to rules via their objectName
+_MAIN_QSS = """
+QMainWindow {
+    background-color: #f8fafc;
+}
+QGroupBox {
+    font-weight: 600;
+    font-size: 13px;
+    color: #475569;
+    border: 1px solid #e2e8f0;
+    border-radius: 12px;
+    margin-top: 16px;
+    padding: 16px 12px 12px 12px;
+    background-color: #ffffff;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 16px;
+    padding: 0 8px;
+    background-color: #ffffff;
+}
+QPushButton {
+    padding: 10px 20px;
+    border-radius: 8px;
+    font-weight: 600;
+    min-width: 120px;
+    font-size: 13px;
+    border: none;
+}
+QPushButton:pressed {
+    padding-top: 11px;
+    padding-bottom: 9px;
+}
+QPushButton#readBtn {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #22c55e, stop:1 #16a34a);
+    color: white;
+    min-width: 150px;
+    padding: 12px 24px;
+    font-size: 14px;
+}
+QPushButton#readBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #16a34a, stop:1 #15803d);
+}
+QPushButton#writeBtn {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3b82f6, stop:1 #2563eb);
+    color: white;
+    min-width: 150px;
+    padding: 12px 24px;
+    font-size: 14px;
+}
+QPushButton#writeBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #2563eb, stop:1 #1d4ed8);
+}
+QPushButton#updateBtn {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #a855f7, stop:1 #9333ea);
+    color: white;
+    min-width: 150px;
+    padding: 12px 24px;
+    font-size: 14px;
+}
+QPushButton#updateBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #9333ea, stop:1 #7e22ce);
+}
+QPushButton#actionBtn {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #f97316, stop:1 #ea580c);
+    color: white;
+    padding: 14px 28px;
+    font-size: 14px;
+    min-width: 150px;
+}
+QPushButton#actionBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #ea580c, stop:1 #c2410c);
+}
+QPushButton#secondaryBtn {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #64748b, stop:1 #475569);
+    color: white;
+}
+QPushButton#secondaryBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #475569, stop:1 #334155);
+}
+QLineEdit {
+    padding: 10px 12px;
+    border: 1px solid #e2e8f0;
+    border-radius: 8px;
+    background-color: #ffffff;
+    font-size: 13px;
+    selection-background-color: #3b82f6;
+}
+QLineEdit:focus {
+    border: 2px solid #3b82f6;
+    padding: 9px 11px;
+}
+QCheckBox {
+    spacing: 10px;
+    font-size: 13px;
+    color: #334155;
+}
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+    border-radius: 4px;
+    border: 2px solid #cbd5e1;
+    background-color: #ffffff;
+}
+QCheckBox::indicator:checked {
+    background-color: #3b82f6;
+    border-color: #3b82f6;
+}
+QCheckBox::indicator:hover {
+    border-color: #3b82f6;
+}
+QLabel#statusLabel {
+    padding: 12px 16px;
+    border-radius: 10px;
+    font-weight: 600;
+    font-size: 13px;
+    color: white;
+}
+QLabel#statusLabel[state="initializing"] {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #fbbf24, stop:1 #f59e0b);
+}
+QLabel#statusLabel[state="connected"] {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #22c55e, stop:1 #16a34a);
+}
+QLabel#statusLabel[state="error"] {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ef4444, stop:1 #dc2626);
+}
+QLabel#statusLabel[state="present"] {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f97316, stop:1 #ea580c);
+}
+QSpinBox {
+    padding: 8px 12px;
+    border: 1px solid #e2e8f0;
+    border-radius: 8px;
+    background-color: #ffffff;
+    font-size: 13px;
+    min-width: 80px;
+}
+QSpinBox:focus {
+    border: 2px solid #3b82f6;
+}
+QSpinBox::up-button, QSpinBox::down-button {
+    border: none;
+    width: 20px;
+}
+QProgressBar {
+    border: none;
+    border-radius: 6px;
+    background-color: #e2e8f0;
+    height: 12px;
+    text-align: center;
+}
+QProgressBar::chunk {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #3b82f6, stop:1 #8b5cf6);
+    border-radius: 6px;
+}
+QLabel#statusMessage {
+    padding: 24px;
+    font-size: 15px;
+    font-weight: 500;
+    color: #475569;
+    background-color: #ffffff;
+    border-radius: 12px;
+    border: 1px solid #e2e8f0;
+}
+QLabel#statusMessage[level="success"] {
+    color: #166534;
+    background-color: #f0fdf4;
+    border: 2px solid #22c55e;
+}
+QLabel#statusMessage[level="error"] {
+    color: #991b1b;
+    background-color: #fef2f2;
+    border: 2px solid #ef4444;
+}
+QLabel#statusMessage[level="warning"] {
+    color: #9a3412;
+    background-color: #fff7ed;
+    border: 2px solid #f97316;
+}
+QLabel#statusMessage[level="info"] {
+    color: #1e40af;
+    background-color: #eff6ff;
+    border: 2px solid #3b82f6;
+}
+QFrame#urlDisplayFrame {
+    background-color: #f0f9ff;
+    border: 2px solid #06b6d4;
+    border-radius: 10px;
+    padding: 8px;
+}
+QLabel#urlDisplayHeader {
+    color: #0e7490;
+    font-weight: 600;
+    font-size: 12px;
+    padding: 8px;
+}
+QPlainTextEdit#copiedUrlDisplay {
+    color: #164e63;
+    font-size: 14px;
+    font-family: 'SF Mono', 'Consolas', monospace;
+    padding: 8px;
+    background-color: #ffffff;
+    border: 1px solid #cffafe;
+    border-radius: 6px;
+}
+QFrame#updateModeFrame {
+    background-color: #faf5ff;
+    border: 2px solid #a855f7;
+    border-radius: 10px;
+    padding: 8px;
+}
+QLabel#updateUrlHeader {
+    color: #7e22ce;
+    font-weight: 600;
+    font-size: 12px;
+    padding: 8px;
+}
+QPlainTextEdit#updateOriginalUrlDisplay {
+    color: #581c87;
+    font-size: 13px;
+    font-family: 'SF Mono', 'Consolas', monospace;
+    padding: 8px;
+    background-color: #ffffff;
+    border: 1px solid #e9d5ff;
+    border-radius: 6px;
+}
+QLineEdit#updateTargetUrlInput {
+    padding: 10px 12px;
+    border: 1px solid #e9d5ff;
+    border-radius: 8px;
+    background-color: #ffffff;
+    font-size: 13px;
+    font-family: 'SF Mono', 'Consolas', monospace;
+}
+QLineEdit#updateTargetUrlInput:focus {
+    border: 2px solid #a855f7;
+    padding: 9px 11px;
+}
+QPushButton#updateConfirmBtn {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #a855f7, stop:1 #9333ea);
+    color: white;
+    font-weight: 600;
+    padding: 12px 24px;
+    border-radius: 8px;
+    font-size: 14px;
+    min-width: 180px;
+}
+QPushButton#updateConfirmBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #9333ea, stop:1 #7e22ce);
+}
+QPushButton#updateConfirmBtn:disabled {
+    background: #d4d4d4;
+    color: #737373;
+}
+QMessageBox {
+    background-color: #ffffff;
+}
+QMessageBox QPushButton {
+    min-width: 80px;
+    padding: 8px 16px;
+}
+"""
+
+# Settings dialog stylesheet, applied once when the dialog is built
+_SETTINGS_QSS = """
+QLabel#readerLabel {
+    font-family: monospace;
+    color: #333;
+}
+QLabel#settingsHelp {
+    color: #666;
+    font-size: 11px;
+}
+QPushButton#settingsSaveBtn {
+    background-color: #4CAF50;
+    color: white;
+    font-weight: bold;
+}
+"""
+
+# Mode button stylesheets keyed by objectName; %s takes the active underline
+_MODE_BUTTON_QSS = {
+    "readBtn": """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #22c55e, stop:1 #16a34a);
+    color: white;
+    min-width: 150px;
+    padding: 12px 24px;
+    border-radius: 8px;
+    font-weight: 600;
+    font-size: 14px;
+    border: none;
+    %s
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #16a34a, stop:1 #15803d);
+}
+""",
+    "writeBtn": """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3b82f6, stop:1 #2563eb);
+    color: white;
+    min-width: 150px;
+    padding: 12px 24px;
+    border-radius: 8px;
+    font-weight: 600;
+    font-size: 14px;
+    border: none;
+    %s
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #2563eb, stop:1 #1d4ed8);
+}
+""",
+    "updateBtn": """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #a855f7, stop:1 #9333ea);
+    color: white;
+    min-width: 150px;
+    padding: 12px 24px;
+    border-radius: 8px;
+    font-weight: 600;
+    font-size: 14px;
+    border: none;
+    %s
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #9333ea, stop:1 #7e22ce);
+}
+""",
+}
+
+# Red underline marking the active mode button
+_MODE_BUTTON_UNDERLINE = "border-bottom: 3px solid #ef4444;"
+
+# Levels with a QLabel#statusMessage[level=...] rule; anything else shows as info
+_STATUS_LEVELS = frozenset(("success", "error", "warning", "info"))
+
+# Error/warning phrases that trigger a voice announcement, matched in one
+# pass; listed in priority order for messages containing several phrases
+_STATUS_TTS = {
+    "no url found": "no_tag_found",
+    "empty tag": "no_tag_found",
+    "communication error": "comm_error",
+    "failed to read": "read_failed",
+}
+_STATUS_TTS_RE = re.compile("|".join(map(re.escape, _STATUS_TTS)), re.IGNORECASE)
+_STATUS_TTS_PRIORITY = {phrase: i for i, phrase in enumerate(_STATUS_TTS)}
+
+# Schemes accepted as-is in URL inputs; anything else gets https:// prepended
+_URL_SCHEMES = ("http://", "https://")
+
+# Tray icons keyed by mode, loaded from disk once per process
+_ICON_CACHE = {}
+
+# Tray icon SVGs (in _ASSETS_DIR) per mode, and the fallback circle colors (RGB) if they fail to load
+_ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "assets")
+_TRAY_ICON_FILES = {
+    "read": "tray-read.svg",
+    "write": "tray-write.svg",
+    "update": "tray-update.svg",
+}
+_TRAY_ICON_COLORS = {
+    "read": (34, 197, 94),    # Green
+    "write": (59, 130, 246),  # Blue
+    "update": (168, 85, 247), # Purple
+}
+
+# Tray menu layout: (label, slot, attribute to store the action as, checkable);
+# None is a separator
+_TRAY_ACTIONS = (
+    ("Show Window", "show_window", None, False),
+    ("Minimize to Tray", "hide_to_tray", None, False),
+    None,
+    ("Read Mode", "_tray_set_read_mode", "tray_read_action", True),
+    ("Write Mode", "_tray_set_write_mode", "tray_write_action", True),
+    ("Update Mode", "_tray_set_update_mode", "tray_update_action", True),
+    None,
+    ("Background Read Mode", "toggle_background_read", "background_read_action", True),
+    None,
+    ("Quit", "quit_application", None, False),
+)
+
+# Shared fonts, built once by _get_fonts() after the QApplication exists
+_TITLE_FONT = None
+_PROGRESS_FONT = None
+
+
+def _get_fonts():
+    """Return the (title, progress) fonts, creating them on first call"""
+    global _TITLE_FONT, _PROGRESS_FONT
+    if _TITLE_FONT is None and QApplication.instance() is not None:
+        _TITLE_FONT = QFont()
+        _TITLE_FONT.setPointSize(18)
+        _TITLE_FONT.setBold(True)
+
+        _PROGRESS_FONT = QFont()
+        _PROGRESS_FONT.setPointSize(12)
+        _PROGRESS_FONT.setBold(True)
+    return _TITLE_FONT, _PROGRESS_FONT
+
+
+# Sound file paths keyed by sound name, built once by _get_sounds()
+_SOUNDS_DIR = os.path.join(os.path.dirname(__file__), "sounds")
+_SYSTEM_SOUNDS_DIR = "/usr/share/sounds/freedesktop/stereo"
+_TTS_SOUNDS = None
+_BEEP_SOUNDS = None
+# Absolute paplay path for the spawn fallback, or None if it isn't installed
+_PAPLAY = None
+
+
+def _get_sounds():
+    """Return the (tts, beep) sound path dicts, scanning the disk on first call
+
+    Only files that exist are included, so playback is a dict lookup.
+    """
+    global _TTS_SOUNDS, _BEEP_SOUNDS, _PAPLAY
+    if _TTS_SOUNDS is None:
+        # Absolute player path so each spawn is a single execve, no PATH walk
+        _PAPLAY = shutil.which("paplay")
+
+        _TTS_SOUNDS = {}
+        try:
+            with os.scandir(_SOUNDS_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".ogg") and entry.is_file():
+                        _TTS_SOUNDS[entry.name[:-len(".ogg")]] = entry.path
+        except OSError:
+            pass
+
+        _BEEP_SOUNDS = {}
+        for name in ("message", "complete", "dialog-error"):
+            path = os.path.join(_SYSTEM_SOUNDS_DIR, f"{name}.oga")
+            if os.path.exists(path):
+                _BEEP_SOUNDS[name] = path
+    return _TTS_SOUNDS, _BEEP_SOUNDS
+
+
+# void (*ca_finish_callback_t)(ca_context *c, uint32_t id, int error_code, void *userdata)
+_CA_FINISH_CALLBACK = ctypes.CFUNCTYPE(
+    None, ctypes.c_void_p, ctypes.c_uint32, ctypes.c_int, ctypes.c_void_p
+)
+
+
+class _CanberraPlayer:
+    """In-process sound playback through libcanberra (no paplay fork per cue)"""
+
+    def __init__(self, lib):
+        self._lib = lib
+        self._ctx = ctypes.c_void_p()
+        if lib.ca_context_create(ctypes.byref(self._ctx)) != 0:
+            raise OSError("ca_context_create failed")
+        self._next_id = 1
+        self._on_done = {}  # Play id -> callable waiting for that playback to end
+        # One C thunk shared by every play_full call; it must outlive them all
+        self._finished = _CA_FINISH_CALLBACK(self._playback_finished)
+
+    def play(self, path: str, on_done=None) -> bool:
+        """Start playing a sound file asynchronously; False if it failed
+
+        The decoded sample is kept in the sound server's cache (keyed by
+        path), so repeat cues skip reading and decoding the file.
+
+        Args:
+            path: Sound file to play
+            on_done: Called from libcanberra's thread once playback ends
+        """
+        path = path.encode()
+        if on_done is None:
+            return self._lib.ca_context_play(
+                self._ctx, 0,
+                b"event.id", path,
+                b"media.filename", path,
+                b"canberra.cache-control", b"permanent",
+                None,
+            ) == 0
+
+        proplist = ctypes.c_void_p()
+        if self._lib.ca_proplist_create(ctypes.byref(proplist)) != 0:
+            return False
+        try:
+            self._lib.ca_proplist_sets(proplist, b"event.id", path)
+            self._lib.ca_proplist_sets(proplist, b"media.filename", path)
+            self._lib.ca_proplist_sets(proplist, b"canberra.cache-control", b"permanent")
+            play_id = self._next_id
+            self._next_id += 1
+            self._on_done[play_id] = on_done
+            if self._lib.ca_context_play_full(
+                self._ctx, play_id, proplist, self._finished, None
+            ) != 0:
+                del self._on_done[play_id]
+                return False
+            return True
+        finally:
+            self._lib.ca_proplist_destroy(proplist)
+
+    def _playback_finished(self, ctx, play_id, error_code, userdata):
+        """libcanberra completion callback for play(..., on_done)"""
+        on_done = self._on_done.pop(play_id, None)
+        if on_done is not None:
+            on_done()
+
+
+# libcanberra player, loaded once by _get_canberra(); False if unavailable
+_CANBERRA = None
+
+
+def _get_canberra():
+    """Return the shared libcanberra player, or None to fall back to paplay"""
+    global _CANBERRA
+    if _CANBERRA is None:
+        try:
+            # Stable soname; find_library would fork ldconfig/gcc on this thread
+            lib = ctypes.CDLL("libcanberra.so.0")
+            _CANBERRA = _CanberraPlayer(lib)
+        except (OSError, AttributeError):
+            _CANBERRA = False
+    return _CANBERRA or None
+
+
+# Redirect the child's stdout/stderr to /dev/null
+_SPAWN_FILE_ACTIONS = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+]
+
+
+class _SpawnProcess(QRunnable):
+    """Fire-and-forget process launch, run on the global thread pool
+
+    Keeps fork/exec of players and browsers off the GUI thread.
+
+    Short-lived players go through posix_spawn, so argv[0] must be an
+    absolute path (see shutil.which); the pool thread then waits for the
+    player so it doesn't linger as a zombie. new_session launches (the
+    browser) outlive the app, so they use Popen, which closes every
+    inherited fd rather than only close-on-exec ones and reaps the child
+    on later Popen calls.
+    """
+
+    def __init__(self, argv, new_session=False, on_error=None, on_launched=None):
+        super().__init__()
+        self.argv = argv
+        self.new_session = new_session
+        self.on_error = on_error  # Called with the exception; must be thread-safe
+        self.on_launched = on_launched  # Called once the launch attempt is over; must be thread-safe
+
+    def run(self):
+        pid = None
+        try:
+            if self.new_session:
+                subprocess.Popen(
+                    self.argv,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                    start_new_session=True,
+                )
+            else:
+                pid = os.posix_spawn(
+                    self.argv[0],
+                    self.argv,
+                    os.environ,
+                    file_actions=_SPAWN_FILE_ACTIONS,
+                )
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(e)
+
+        if self.on_launched is not None:
+            self.on_launched()
+        if pid is not None:
+            # Cues last a second or two; block this pool thread, not the GUI
+            os.waitpid(pid, 0)
+
+
+def _repaint_once(method):
+    """Run a no-argument widget method with painting suspended until it returns"""
+    @wraps(method)
+    def wrapper(self):
+        self.setUpdatesEnabled(False)
+        try:
+            return method(self)
+        finally:
+            self.setUpdatesEnabled(True)
+    return wrapper
 
 
 class NFCSignals(QObject):
@@ -53,6 +691,43 @@ class NFCSignals(QObject):
     log_message = pyqtSignal(str, str)  # message, level
 
 
+class NFCWorker(QObject):
+    """Runs blocking reader initialization off the GUI thread.
+
+    Tag events from the card monitor are forwarded through NFCSignals, so
+    the GUI slots always execute on the main thread.
+    """
+
+    reader_ready = pyqtSignal(bool, str)  # connected, error message (empty if none)
+
+    def __init__(self, nfc_handler: NFCHandler, signals: NFCSignals):
+        super().__init__()
+        self.nfc_handler = nfc_handler
+        self.signals = signals
+
+    @pyqtSlot()
+    def run(self):
+        """Connect to the reader and start monitoring for tags"""
+        try:
+            if not self.nfc_handler.initialize_reader():
+                self.reader_ready.emit(False, "")
+                return
+
+            # Start monitoring with signal emitters as callbacks (thread-safe)
+            self.nfc_handler.start_monitoring(
+                read_callback=self.signals.tag_read.emit,
+                write_callback=self.signals.tag_written.emit,
+                update_callback=self.signals.tag_updated.emit,
+                log_callback=self.signals.log_message.emit,
+                outdated_callback=self.signals.outdated_detected.emit,
+                update_scan_callback=self.signals.update_tag_scanned.emit,
+                locked_tag_callback=self.signals.locked_tag_with_url.emit,
+            )
+            self.reader_ready.emit(True, "")
+        except Exception as e:
+            self.reader_ready.emit(False, str(e) or e.__class__.__name__)
+
+
 class SettingsDialog(QWidget):
     """Settings dialog for configuring URL rewrite rules and showing reader info."""
 
@@ -64,9 +739,40 @@ class SettingsDialog(QWidget):
         self.setWindowTitle("Settings")
         self.setWindowFlags(Qt.Window | Qt.WindowCloseButtonHint)
         self.setMinimumWidth(500)
+        # Compiled source pattern (or its compile error), reused until the
+        # pattern text changes
+        self._compiled_pattern = None
+        self._compiled_pattern_error = None
+        self._compiled_pattern_prefix = None
+        self._compiled_pattern_src = None
+        # Coalesce bursts of keystrokes into a single test evaluation
+        self._test_timer = QTimer(self)
+        self._test_timer.setSingleShot(True)
+        self._test_timer.setInterval(150)
+        self._test_timer.timeout.connect(self.update_test_result)
         self.init_ui()
 
+    def _compile_pattern(self, pattern: str):
+        """Return the compiled pattern, recompiling only when the text changed.
+
+        Raises:
+            re.error: If the pattern is not a valid regex
+        """
+        if pattern != self._compiled_pattern_src:
+            self._compiled_pattern_src = pattern
+            try:
+                self._compiled_pattern = compile_pattern(pattern)
+                self._compiled_pattern_error = None
+                self._compiled_pattern_prefix = literal_prefix(pattern)
+            except re.error as e:
+                self._compiled_pattern = None
+                self._compiled_pattern_error = e
+        if self._compiled_pattern_error is not None:
+            raise self._compiled_pattern_error
+        return self._compiled_pattern
+
     def init_ui(self):
+        self.setStyleSheet(_SETTINGS_QSS)
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -76,10 +782,10 @@ class SettingsDialog(QWidget):
             reader_group = QGroupBox("Connected Reader")
             reader_layout = QVBoxLayout()
 
-            reader_label = QLabel(self.reader_info)
-            reader_label.setStyleSheet("font-family: monospace; color: #333;")
-            reader_label.setWordWrap(True)
-            reader_layout.addWidget(reader_label)
+            self.reader_label = QLabel(self.reader_info)
+            self.reader_label.setObjectName("readerLabel")
+            self.reader_label.setWordWrap(True)
+            reader_layout.addWidget(self.reader_label)
 
             reader_group.setLayout(reader_layout)
             layout.addWidget(reader_group)
@@ -152,7 +858,7 @@ class SettingsDialog(QWidget):
         password_help = QLabel(
             "Set a password to enable 'Password Protect' option in Write Mode"
         )
-        password_help.setStyleSheet("color: #666; font-size: 11px;")
+        password_help.setObjectName("settingsHelp")
         write_layout.addWidget(password_help)
 
         write_group.setLayout(write_layout)
@@ -167,13 +873,13 @@ class SettingsDialog(QWidget):
         self.pattern_input.setPlaceholderText(
             r"^https?://10\.0\.0\.\d+(?::\d+)?/+item/(.+)$"
         )
-        self.pattern_input.textChanged.connect(self.update_test_result)
+        self.pattern_input.textChanged.connect(self._test_timer.start)
         pattern_layout.addWidget(self.pattern_input)
 
         pattern_help = QLabel(
             "Use (.+) to capture the item ID that will be appended to the target URL"
         )
-        pattern_help.setStyleSheet("color: #666; font-size: 11px;")
+        pattern_help.setObjectName("settingsHelp")
         pattern_layout.addWidget(pattern_help)
 
         pattern_group.setLayout(pattern_layout)
@@ -186,13 +892,13 @@ class SettingsDialog(QWidget):
         self.target_input = QLineEdit()
         self.target_input.setText(self.settings.target_base_url)
         self.target_input.setPlaceholderText("https://your-domain.com/item/")
-        self.target_input.textChanged.connect(self.update_test_result)
+        self.target_input.textChanged.connect(self._test_timer.start)
         target_layout.addWidget(self.target_input)
 
         target_help = QLabel(
             "Item ID will be appended automatically (e.g., https://domain.com/item/{id})"
         )
-        target_help.setStyleSheet("color: #666; font-size: 11px;")
+        target_help.setObjectName("settingsHelp")
         target_layout.addWidget(target_help)
 
         target_group.setLayout(target_layout)
@@ -206,16 +912,35 @@ class SettingsDialog(QWidget):
         test_url_layout.addWidget(QLabel("Test URL:"))
         self.test_input = QLineEdit()
         self.test_input.setPlaceholderText("http://10.0.0.1:3100/item/abc123")
-        self.test_input.textChanged.connect(self.update_test_result)
+        self.test_input.textChanged.connect(self._test_timer.start)
+        # Enter / focus-out shows the result right away instead of waiting
+        self.test_input.editingFinished.connect(self._flush_test_result)
         test_url_layout.addWidget(self.test_input)
         test_layout.addLayout(test_url_layout)
 
         result_layout = QHBoxLayout()
         result_layout.addWidget(QLabel("Result:"))
         self.result_label = QLabel("Enter a test URL above")
-        self.result_label.setStyleSheet("color: #666;")
         self.result_label.setWordWrap(True)
         result_layout.addWidget(self.result_label, 1)
+
+        # Prebuilt palettes/fonts so result state changes avoid a QSS reparse
+        base_palette = self.result_label.palette()
+        self._result_palettes = {}
+        for state, color in (
+            ("neutral", "#666"),
+            ("warn", "#ff9800"),
+            ("ok", "#4CAF50"),
+            ("err", "#f44336"),
+        ):
+            palette = QPalette(base_palette)
+            palette.setColor(QPalette.WindowText, QColor(color))
+            self._result_palettes[state] = palette
+        self._result_font = QFont(self.result_label.font())
+        self._result_font_bold = QFont(self._result_font)
+        self._result_font_bold.setBold(True)
+        self.result_label.setPalette(self._result_palettes["neutral"])
+        self._result_state = "neutral"
         test_layout.addLayout(result_layout)
 
         test_group.setLayout(test_layout)
@@ -230,46 +955,90 @@ class SettingsDialog(QWidget):
         button_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("Save")
-        save_btn.setStyleSheet(
-            "background-color: #4CAF50; color: white; font-weight: bold;"
-        )
+        save_btn.setObjectName("settingsSaveBtn")
         save_btn.clicked.connect(self.save_settings)
         button_layout.addWidget(save_btn)
 
         layout.addLayout(button_layout)
 
+    def refresh_from_settings(self, reader_info: str = None):
+        """Reload input values from settings without rebuilding the widgets."""
+        if reader_info is not None and hasattr(self, "reader_label"):
+            self.reader_info = reader_info
+            self.reader_label.setText(reader_info)
+
+        # Block signals so reloading values doesn't schedule test evaluations
+        with ExitStack() as blockers:
+            for widget in (
+                self.tts_checkbox,
+                self.auto_open_browser_checkbox,
+                self.open_locked_url_checkbox,
+                self.password_input,
+                self.pattern_input,
+                self.target_input,
+            ):
+                blockers.enter_context(QSignalBlocker(widget))
+            self.tts_checkbox.setChecked(self.settings.tts_enabled)
+            self.auto_open_browser_checkbox.setChecked(self.settings.auto_open_browser)
+            self.open_locked_url_checkbox.setChecked(self.settings.open_locked_tag_url)
+            self.password_input.setText(self.settings.tag_password)
+            self.pattern_input.setText(self.settings.source_pattern)
+            self.target_input.setText(self.settings.target_base_url)
+        # Evaluate now; any test still queued from earlier typing is stale
+        self._test_timer.stop()
+        self.update_test_result()
+
+    def _set_result(self, text: str, state: str):
+        """Show a test result message
+
+        Args:
+            text: Message to display
+            state: One of 'neutral', 'warn', 'ok', 'err'
+        """
+        self.result_label.setText(text)
+        if state == self._result_state:
+            return
+        self._result_state = state
+        self.result_label.setPalette(self._result_palettes[state])
+        self.result_label.setFont(
+            self._result_font_bold if state == "ok" else self._result_font
+        )
+
+    @pyqtSlot()
+    def _flush_test_result(self):
+        """Run a pending debounced test evaluation immediately"""
+        if self._test_timer.isActive():
+            self._test_timer.stop()
+            self.update_test_result()
+
+    @pyqtSlot()
     def update_test_result(self):
         """Update the test result preview."""
-        test_url = self.test_input.text().strip()
+        # Snapshot all three fields once, then branch on the trimmed values
+        pattern, target, test_url = (
+            field.text().strip()
+            for field in (self.pattern_input, self.target_input, self.test_input)
+        )
+
         if not test_url:
-            self.result_label.setText("Enter a test URL above")
-            self.result_label.setStyleSheet("color: #666;")
+            self._set_result("Enter a test URL above", "neutral")
             return
 
-        pattern = self.pattern_input.text().strip()
-        target = self.target_input.text().strip()
-
         if not pattern or not target:
-            self.result_label.setText("Configure pattern and target first")
-            self.result_label.setStyleSheet("color: #ff9800;")
+            self._set_result("Configure pattern and target first", "warn")
             return
 
-        import re
-
         try:
-            match = re.match(pattern, test_url)
-            if match:
-                item_id = match.group(1)
-                target_base = target.rstrip("/") + "/"
-                result = f"{target_base}{item_id}"
-                self.result_label.setText(result)
-                self.result_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
+            item_id = match_item_id(
+                self._compile_pattern(pattern), self._compiled_pattern_prefix, test_url
+            )
+            if item_id is not None:
+                target_base = normalize_target_base(target)
+                self._set_result(f"{target_base}{item_id}", "ok")
             else:
-                self.result_label.setText("Pattern does not match test URL")
-                self.result_label.setStyleSheet("color: #f44336;")
+                self._set_result("Pattern does not match test URL", "err")
         except re.error as e:
-            self.result_label.setText(f"Invalid regex: {e}")
-            self.result_label.setStyleSheet("color: #f44336;")
+            self._set_result(f"Invalid regex: {e}", "err")
 
     def test_voice(self):
         """Play a test voice announcement."""
@@ -288,15 +1057,15 @@ class SettingsDialog(QWidget):
             return
 
         # Validate regex
-        import re
-
         try:
-            re.compile(pattern)
+            compiled = self._compile_pattern(pattern)
         except re.error as e:
             QMessageBox.critical(self, "Error", f"Invalid regex pattern:\n{e}")
             return
 
-        self.settings.set_rewrite_rule(pattern, target)
+        self.settings.set_rewrite_rule(
+            pattern, target, compiled, target_base=normalize_target_base(target)
+        )
         self.settings.tts_enabled = self.tts_checkbox.isChecked()
         self.settings.auto_open_browser = self.auto_open_browser_checkbox.isChecked()
         self.settings.open_locked_tag_url = self.open_locked_url_checkbox.isChecked()
@@ -310,6 +1079,9 @@ class SettingsDialog(QWidget):
 
 
 class NFCGui(QMainWindow):
+    # First http:// or https:// in a pasted string
+    _URL_PREFIX_RE = re.compile(r"https?://")
+
     def __init__(self):
         super().__init__()
 
@@ -317,205 +1089,90 @@ class NFCGui(QMainWindow):
         self.settings = Settings()
 
         # Create signals for thread-safe communication
+        # Signals are emitted from the card monitor thread; queue them explicitly
         self.signals = NFCSignals()
-        self.signals.tag_read.connect(self.on_tag_read)
-        self.signals.tag_written.connect(self.on_tag_written)
-        self.signals.tag_updated.connect(self.on_tag_updated)
-        self.signals.outdated_detected.connect(self.on_outdated_detected)
-        self.signals.update_tag_scanned.connect(self.on_update_tag_scanned)
-        self.signals.locked_tag_with_url.connect(self.on_locked_tag_with_url)
-        self.signals.log_message.connect(self.log_message)
+        self.signals.tag_read.connect(self.on_tag_read, Qt.QueuedConnection)
+        self.signals.tag_written.connect(self.on_tag_written, Qt.QueuedConnection)
+        self.signals.tag_updated.connect(self.on_tag_updated, Qt.QueuedConnection)
+        self.signals.outdated_detected.connect(
+            self.on_outdated_detected, Qt.QueuedConnection
+        )
+        self.signals.update_tag_scanned.connect(
+            self.on_update_tag_scanned, Qt.QueuedConnection
+        )
+        self.signals.locked_tag_with_url.connect(
+            self.on_locked_tag_with_url, Qt.QueuedConnection
+        )
+        self.signals.log_message.connect(self._queue_log_message, Qt.QueuedConnection)
+
+        # Coalesce bursts of handler log messages into one flush (and repaint)
+        self._pending_logs = []
+        self._log_flush = QTimer(self)
+        self._log_flush.setSingleShot(True)
+        self._log_flush.setInterval(50)
+        self._log_flush.timeout.connect(self._flush_log)
+
+        # Debounce URL edits and batch steps so the handler is reconfigured
+        # once per burst rather than on every keystroke / autorepeat tick
+        self._pending_url = ""
+        self._url_debounce = QTimer(self)
+        self._url_debounce.setSingleShot(True)
+        self._url_debounce.setInterval(150)
+        self._url_debounce.timeout.connect(self._apply_pending_url)
+        self._pending_batch = 1
+        self._batch_debounce = QTimer(self)
+        self._batch_debounce.setSingleShot(True)
+        self._batch_debounce.setInterval(30)
+        self._batch_debounce.timeout.connect(self._apply_pending_batch)
+
+        # Announce only the settled background-mode state in the tray, so
+        # rapid toggles cost one tooltip/notification round-trip
+        self._pending_tray_state = False
+        self._tray_state_timer = QTimer(self)
+        self._tray_state_timer.setSingleShot(True)
+        self._tray_state_timer.setInterval(100)
+        self._tray_state_timer.timeout.connect(self._apply_pending_tray_state)
+
+        # In-process clipboard, shared by the copy/paste actions
+        self._clipboard = QApplication.clipboard()
+
+        # Browser command, resolved once: Chrome, then Chromium, then xdg-open.
+        # None means hand URLs to the desktop via QDesktopServices instead.
+        self._browser_argv = next(
+            (
+                [path]
+                for path in map(shutil.which, ("google-chrome", "chromium-browser", "xdg-open"))
+                if path
+            ),
+            None,
+        )
 
         # NFC Handler with settings
         self.nfc_handler = NFCHandler(debug_mode=False, settings=self.settings)
         self.current_mode = "read"
         self.last_url = None
         self.settings_dialog = None
+        # (url, protection, batch) last applied by set_write_mode; cleared by
+        # every other path that reconfigures the handler's write setup
+        self._last_write_config = None
+        self.tray_icon = None  # Built on first tray use (see _ensure_tray_initialised)
 
         # Setup UI
         self.init_ui()
 
-        # Setup system tray
-        self.setup_system_tray()
-
         # Initialize NFC
         self.initialize_nfc()
 
+    @_repaint_once
     def init_ui(self):
-        """Initialize the user interface"""
+        """Initialize the user interface
+
+        Painting is suspended while the widget tree is built so the window
+        gets a single layout and paint pass at the end.
+        """
         self.setWindowTitle("NFC Reader/Writer - ACS ACR1252 - v1.4.16")
         self.setGeometry(100, 100, 800, 520)
 
-        # Set modern stylesheet with contemporary design
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f8fafc;
-            }
-            QGroupBox {
-                font-weight: 600;
-                font-size: 13px;
-                color: #475569;
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                margin-top: 16px;
-                padding: 16px 12px 12px 12px;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 16px;
-                padding: 0 8px;
-                background-color: #ffffff;
-            }
-            QPushButton {
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: 600;
-                min-width: 120px;
-                font-size: 13px;
-                border: none;
-            }
-            QPushButton:pressed {
-                padding-top: 11px;
-                padding-bottom: 9px;
-            }
-            QPushButton#readBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #22c55e, stop:1 #16a34a);
-                color: white;
-                min-width: 150px;
-                padding: 12px 24px;
-                font-size: 14px;
-            }
-            QPushButton#readBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #16a34a, stop:1 #15803d);
-            }
-            QPushButton#writeBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3b82f6, stop:1 #2563eb);
-                color: white;
-                min-width: 150px;
-                padding: 12px 24px;
-                font-size: 14px;
-            }
-            QPushButton#writeBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2563eb, stop:1 #1d4ed8);
-            }
-            QPushButton#updateBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #a855f7, stop:1 #9333ea);
-                color: white;
-                min-width: 150px;
-                padding: 12px 24px;
-                font-size: 14px;
-            }
-            QPushButton#updateBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #9333ea, stop:1 #7e22ce);
-            }
-            QPushButton#actionBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f97316, stop:1 #ea580c);
-                color: white;
-                padding: 14px 28px;
-                font-size: 14px;
-                min-width: 150px;
-            }
-            QPushButton#actionBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ea580c, stop:1 #c2410c);
-            }
-            QPushButton#secondaryBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #64748b, stop:1 #475569);
-                color: white;
-            }
-            QPushButton#secondaryBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #475569, stop:1 #334155);
-            }
-            QLineEdit {
-                padding: 10px 12px;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                background-color: #ffffff;
-                font-size: 13px;
-                selection-background-color: #3b82f6;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3b82f6;
-                padding: 9px 11px;
-            }
-            QTextEdit {
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                background-color: #ffffff;
-                font-family: 'SF Mono', 'Consolas', monospace;
-                padding: 8px;
-            }
-            QCheckBox {
-                spacing: 10px;
-                font-size: 13px;
-                color: #334155;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 2px solid #cbd5e1;
-                background-color: #ffffff;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #3b82f6;
-                border-color: #3b82f6;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #3b82f6;
-            }
-            QLabel#statusLabel {
-                padding: 12px 16px;
-                border-radius: 10px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QSpinBox {
-                padding: 8px 12px;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                background-color: #ffffff;
-                font-size: 13px;
-                min-width: 80px;
-            }
-            QSpinBox:focus {
-                border: 2px solid #3b82f6;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                border: none;
-                width: 20px;
-            }
-            QProgressBar {
-                border: none;
-                border-radius: 6px;
-                background-color: #e2e8f0;
-                height: 12px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3b82f6, stop:1 #8b5cf6);
-                border-radius: 6px;
-            }
-            QMessageBox {
-                background-color: #ffffff;
-            }
-            QMessageBox QPushButton {
-                min-width: 80px;
-                padding: 8px 16px;
-            }
-        """)
-
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -526,9 +1183,7 @@ class NFCGui(QMainWindow):
         # Header
         header_layout = QHBoxLayout()
         title_label = QLabel("NFC Reader/Writer")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
+        title_font, progress_font = _get_fonts()
         title_label.setFont(title_font)
         header_layout.addWidget(title_label)
 
@@ -536,172 +1191,23 @@ class NFCGui(QMainWindow):
 
         self.status_label = QLabel("Initializing...")
         self.status_label.setObjectName("statusLabel")
-        self.status_label.setStyleSheet(
-            "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #fbbf24, stop:1 #f59e0b); color: white;"
-        )
+        self.status_label.setProperty("state", "initializing")
         header_layout.addWidget(self.status_label)
 
         # Settings button
-        settings_btn = QPushButton("Settings")
-        settings_btn.setObjectName("secondaryBtn")
-        settings_btn.setToolTip("Configure URL rewrite settings")
-        settings_btn.clicked.connect(self.open_settings)
-        header_layout.addWidget(settings_btn)
-
-        main_layout.addLayout(header_layout)
-
-        # URL display box for Copy URL Mode (hidden by default)
-        self.url_display_frame = QFrame()
-        self.url_display_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f0f9ff;
-                border: 2px solid #06b6d4;
-                border-radius: 10px;
-                padding: 8px;
-            }
-        """)
-        url_display_layout = QVBoxLayout(self.url_display_frame)
-        url_display_layout.setContentsMargins(12, 8, 12, 8)
-
-        url_display_header = QLabel("Copied URL:")
-        url_display_header.setStyleSheet(
-            "color: #0e7490; font-weight: 600; font-size: 12px; border: none;"
-        )
-        url_display_layout.addWidget(url_display_header)
-
-        self.copied_url_display = QLabel("Present a tag to copy its URL")
-        self.copied_url_display.setStyleSheet("""
-            QLabel {
-                color: #164e63;
-                font-size: 14px;
-                font-family: 'SF Mono', 'Consolas', monospace;
-                padding: 8px;
-                background-color: #ffffff;
-                border: 1px solid #cffafe;
-                border-radius: 6px;
-            }
-        """)
-        self.copied_url_display.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.copied_url_display.setWordWrap(True)
-        url_display_layout.addWidget(self.copied_url_display)
-
-        self.url_display_frame.setVisible(False)  # Hidden by default
-        main_layout.addWidget(self.url_display_frame)
-
-        # Update mode UI frame (hidden by default)
-        self.update_mode_frame = QFrame()
-        self.update_mode_frame.setStyleSheet("""
-            QFrame {
-                background-color: #faf5ff;
-                border: 2px solid #a855f7;
-                border-radius: 10px;
-                padding: 8px;
-            }
-        """)
-        update_mode_layout = QVBoxLayout(self.update_mode_frame)
-        update_mode_layout.setContentsMargins(12, 8, 12, 8)
-        update_mode_layout.setSpacing(10)
-
-        # Original URL display (read-only)
-        original_url_header = QLabel("Scanned URL:")
-        original_url_header.setStyleSheet(
-            "color: #7e22ce; font-weight: 600; font-size: 12px; border: none;"
-        )
-        update_mode_layout.addWidget(original_url_header)
-
-        self.update_original_url_display = QLabel("Present a tag to scan")
-        self.update_original_url_display.setStyleSheet("""
-            QLabel {
-                color: #581c87;
-                font-size: 13px;
-                font-family: 'SF Mono', 'Consolas', monospace;
-                padding: 8px;
-                background-color: #ffffff;
-                border: 1px solid #e9d5ff;
-                border-radius: 6px;
-            }
-        """)
-        self.update_original_url_display.setTextInteractionFlags(
-            Qt.TextSelectableByMouse
-        )
-        self.update_original_url_display.setWordWrap(True)
-        update_mode_layout.addWidget(self.update_original_url_display)
-
-        # Target URL input (editable, pre-populated with suggestion)
-        target_url_header = QLabel("New URL to write:")
-        target_url_header.setStyleSheet(
-            "color: #7e22ce; font-weight: 600; font-size: 12px; border: none;"
+        self._add_button(
+            header_layout, "Settings", "secondaryBtn",
+            "Configure URL rewrite settings", self.open_settings,
         )
-        update_mode_layout.addWidget(target_url_header)
-
-        target_input_layout = QHBoxLayout()
-        self.update_target_url_input = QLineEdit()
-        self.update_target_url_input.setPlaceholderText(
-            "Auto-suggestion will appear here, or paste your own URL..."
-        )
-        self.update_target_url_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px 12px;
-                border: 1px solid #e9d5ff;
-                border-radius: 8px;
-                background-color: #ffffff;
-                font-size: 13px;
-                font-family: 'SF Mono', 'Consolas', monospace;
-            }
-            QLineEdit:focus {
-                border: 2px solid #a855f7;
-                padding: 9px 11px;
-            }
-        """)
-        target_input_layout.addWidget(self.update_target_url_input, 1)
-
-        self.update_paste_btn = QPushButton("Paste")
-        self.update_paste_btn.setObjectName("secondaryBtn")
-        self.update_paste_btn.clicked.connect(self.paste_update_url)
-        target_input_layout.addWidget(self.update_paste_btn)
-
-        update_mode_layout.addLayout(target_input_layout)
 
-        # Confirm button
-        confirm_layout = QHBoxLayout()
-        confirm_layout.addStretch()
-
-        self.update_confirm_btn = QPushButton("Confirm & Ready to Write")
-        self.update_confirm_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #a855f7, stop:1 #9333ea);
-                color: white;
-                font-weight: 600;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-size: 14px;
-                min-width: 180px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #9333ea, stop:1 #7e22ce);
-            }
-            QPushButton:disabled {
-                background: #d4d4d4;
-                color: #737373;
-            }
-        """)
-        self.update_confirm_btn.setEnabled(False)
-        self.update_confirm_btn.clicked.connect(self.confirm_update_write)
-        confirm_layout.addWidget(self.update_confirm_btn)
-
-        self.update_cancel_btn = QPushButton("Cancel")
-        self.update_cancel_btn.setObjectName("secondaryBtn")
-        self.update_cancel_btn.clicked.connect(self.cancel_update)
-        self.update_cancel_btn.setVisible(False)
-        confirm_layout.addWidget(self.update_cancel_btn)
-
-        confirm_layout.addStretch()
-        update_mode_layout.addLayout(confirm_layout)
+        main_layout.addLayout(header_layout)
 
-        self.update_mode_frame.setVisible(False)  # Hidden by default
-        main_layout.addWidget(self.update_mode_frame)
+        # Copy URL and update mode frames are only built on first use
+        self.url_display_frame = None
+        self.update_mode_frame = None
+        self._mode_frame_layout = QVBoxLayout()
+        self._mode_frame_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addLayout(self._mode_frame_layout)
 
         # Control panel
         control_group = QGroupBox("Controls")
@@ -711,33 +1217,42 @@ class NFCGui(QMainWindow):
         mode_layout = QHBoxLayout()
         mode_layout.addStretch()
 
-        self.read_btn = QPushButton("Read Mode")
-        self.read_btn.setObjectName("readBtn")
-        self.read_btn.setToolTip(
-            "Switch to read mode - automatically opens scanned URLs (Ctrl+R)"
+        self.read_btn = self._add_button(
+            mode_layout, "Read Mode", "readBtn",
+            "Switch to read mode - automatically opens scanned URLs (Ctrl+R)",
+            self.set_read_mode,
         )
-        self.read_btn.clicked.connect(self.set_read_mode)
-        mode_layout.addWidget(self.read_btn)
-
-        self.write_btn = QPushButton("Write Mode")
-        self.write_btn.setObjectName("writeBtn")
-        self.write_btn.setToolTip(
-            "Switch to write mode - write URLs to NFC tags (Ctrl+W)"
+        self.write_btn = self._add_button(
+            mode_layout, "Write Mode", "writeBtn",
+            "Switch to write mode - write URLs to NFC tags (Ctrl+W)",
+            self.set_write_mode,
         )
-        self.write_btn.clicked.connect(self.set_write_mode)
-        mode_layout.addWidget(self.write_btn)
-
-        self.update_btn = QPushButton("Update Mode")
-        self.update_btn.setObjectName("updateBtn")
-        self.update_btn.setToolTip(
-            "Switch to update mode - rewrite old URLs to new format (Ctrl+U)"
+        self.update_btn = self._add_button(
+            mode_layout, "Update Mode", "updateBtn",
+            "Switch to update mode - rewrite old URLs to new format (Ctrl+U)",
+            self.set_update_mode,
         )
-        self.update_btn.clicked.connect(self.set_update_mode)
-        mode_layout.addWidget(self.update_btn)
+
+        # Preformat active/inactive stylesheets for the mode indicator
+        mode_buttons = (self.read_btn, self.write_btn, self.update_btn)
+        self._mode_btn_active_qss = {
+            btn: _MODE_BUTTON_QSS[btn.objectName()] % _MODE_BUTTON_UNDERLINE
+            for btn in mode_buttons
+        }
+        self._mode_btn_inactive_qss = {
+            btn: _MODE_BUTTON_QSS[btn.objectName()] % "" for btn in mode_buttons
+        }
+        self._active_mode_btn = None
 
         mode_layout.addStretch()
         control_layout.addLayout(mode_layout)
 
+        # Write-mode controls share one panel so a mode switch is a single
+        # show/hide and one layout pass
+        self.write_panel = QWidget()
+        write_panel_layout = QVBoxLayout(self.write_panel)
+        write_panel_layout.setContentsMargins(0, 0, 0, 0)
+
         # URL input - Write mode only
         self.url_label = QLabel("URL:")
         self.url_layout = QHBoxLayout()
@@ -750,13 +1265,12 @@ class NFCGui(QMainWindow):
         )  # Auto-update on URL change
         self.url_layout.addWidget(self.url_input, 1)
 
-        self.paste_btn = QPushButton("Paste")
-        self.paste_btn.setObjectName("secondaryBtn")
-        self.paste_btn.setToolTip("Paste URL from clipboard (Ctrl+V)")
-        self.paste_btn.clicked.connect(self.paste_url)
-        self.url_layout.addWidget(self.paste_btn)
+        self.paste_btn = self._add_button(
+            self.url_layout, "Paste", "secondaryBtn",
+            "Paste URL from clipboard (Ctrl+V)", self.paste_url,
+        )
 
-        control_layout.addLayout(self.url_layout)
+        write_panel_layout.addLayout(self.url_layout)
 
         # Options - Write mode only
         self.options_layout = QHBoxLayout()
@@ -790,7 +1304,7 @@ class NFCGui(QMainWindow):
         self.options_layout.addWidget(self.verify_checkbox)
 
         self.options_layout.addStretch()
-        control_layout.addLayout(self.options_layout)
+        write_panel_layout.addLayout(self.options_layout)
 
         # Batch write - Write mode only
         self.batch_layout = QHBoxLayout()
@@ -801,7 +1315,6 @@ class NFCGui(QMainWindow):
         self.batch_minus_btn = QPushButton("−")
         self.batch_minus_btn.setFixedSize(32, 32)
         self.batch_minus_btn.setToolTip("Decrease batch count")
-        self.batch_minus_btn.clicked.connect(self._decrease_batch)
         self.batch_layout.addWidget(self.batch_minus_btn)
 
         self.batch_spinbox = QSpinBox()
@@ -819,11 +1332,15 @@ class NFCGui(QMainWindow):
         self.batch_plus_btn = QPushButton("+")
         self.batch_plus_btn.setFixedSize(32, 32)
         self.batch_plus_btn.setToolTip("Increase batch count")
-        self.batch_plus_btn.clicked.connect(self._increase_batch)
         self.batch_layout.addWidget(self.batch_plus_btn)
 
+        # Step the spinbox directly; valueChanged drives _on_batch_changed
+        self.batch_minus_btn.clicked.connect(self.batch_spinbox.stepDown)
+        self.batch_plus_btn.clicked.connect(self.batch_spinbox.stepUp)
+
         self.batch_layout.addStretch()
-        control_layout.addLayout(self.batch_layout)
+        write_panel_layout.addLayout(self.batch_layout)
+        control_layout.addWidget(self.write_panel)
 
         control_group.setLayout(control_layout)
         main_layout.addWidget(control_group)
@@ -834,9 +1351,6 @@ class NFCGui(QMainWindow):
 
         self.progress_label = QLabel("Not active")
         self.progress_label.setAlignment(Qt.AlignCenter)
-        progress_font = QFont()
-        progress_font.setPointSize(12)
-        progress_font.setBold(True)
         self.progress_label.setFont(progress_font)
         progress_layout.addWidget(self.progress_label)
 
@@ -851,21 +1365,13 @@ class NFCGui(QMainWindow):
         self.progress_group.setLayout(progress_layout)
         main_layout.addWidget(self.progress_group)
         self.progress_group.setVisible(False)  # Hidden by default
+        self._shown_progress = None  # (done, total) last painted
 
         # Simple status message area (replacing verbose activity log)
         self.status_message = QLabel("Ready - present an NFC tag")
         self.status_message.setAlignment(Qt.AlignCenter)
-        self.status_message.setStyleSheet("""
-            QLabel {
-                padding: 24px;
-                font-size: 15px;
-                font-weight: 500;
-                color: #475569;
-                background-color: #ffffff;
-                border-radius: 12px;
-                border: 1px solid #e2e8f0;
-            }
-        """)
+        self.status_message.setObjectName("statusMessage")
+        self._status_level = None
         self.status_message.setMinimumHeight(100)
         main_layout.addWidget(self.status_message)
 
@@ -873,26 +1379,21 @@ class NFCGui(QMainWindow):
         bottom_layout = QHBoxLayout()
         bottom_layout.addStretch()
 
-        copy_btn = QPushButton("Copy Last URL")
-        copy_btn.setObjectName("secondaryBtn")
-        copy_btn.setToolTip("Copy the last scanned URL to clipboard")
-        copy_btn.clicked.connect(self.copy_last_url)
-        bottom_layout.addWidget(copy_btn)
-
-        open_btn = QPushButton("Open Last URL")
-        open_btn.setObjectName("secondaryBtn")
-        open_btn.setToolTip("Open the last scanned URL in Chrome")
-        open_btn.clicked.connect(self.open_last_url)
-        bottom_layout.addWidget(open_btn)
+        self._add_button(
+            bottom_layout, "Copy Last URL", "secondaryBtn",
+            "Copy the last scanned URL to clipboard", self.copy_last_url,
+        )
+        self._add_button(
+            bottom_layout, "Open Last URL", "secondaryBtn",
+            "Open the last scanned URL in Chrome", self.open_last_url,
+        )
 
         # Background mode button
-        background_btn = QPushButton("Background Read Mode")
-        background_btn.setObjectName("secondaryBtn")
-        background_btn.setToolTip(
-            "Minimize to tray and continuously read tags in background"
+        self._add_button(
+            bottom_layout, "Background Read Mode", "secondaryBtn",
+            "Minimize to tray and continuously read tags in background",
+            self.enable_background_mode,
         )
-        background_btn.clicked.connect(self.enable_background_mode)
-        bottom_layout.addWidget(background_btn)
 
         bottom_layout.addStretch()
         main_layout.addLayout(bottom_layout)
@@ -907,6 +1408,145 @@ class NFCGui(QMainWindow):
         self.shortcut_update = QShortcut(QKeySequence("Ctrl+U"), self)
         self.shortcut_update.activated.connect(self.set_update_mode)
 
+    def _ensure_copy_url_frame(self):
+        """Build the copy URL display frame (hidden) if it doesn't exist yet"""
+        if self.url_display_frame is not None:
+            return
+
+        self.url_display_frame = QFrame()
+        self.url_display_frame.setObjectName("urlDisplayFrame")
+        url_display_layout = QVBoxLayout(self.url_display_frame)
+        url_display_layout.setContentsMargins(12, 8, 12, 8)
+
+        url_display_header = QLabel("Copied URL:")
+        url_display_header.setObjectName("urlDisplayHeader")
+        url_display_layout.addWidget(url_display_header)
+
+        # Fixed-height read-only view: new URLs repaint in place without
+        # re-laying out the surrounding frame
+        self.copied_url_display = QPlainTextEdit()
+        self.copied_url_display.setObjectName("copiedUrlDisplay")
+        self.copied_url_display.setPlaceholderText("Present a tag to copy its URL")
+        self.copied_url_display.setReadOnly(True)
+        self.copied_url_display.setFrameShape(QFrame.NoFrame)
+        self.copied_url_display.setFixedHeight(64)
+        url_display_layout.addWidget(self.copied_url_display)
+
+        self.url_display_frame.setVisible(False)  # Hidden by default
+        self._mode_frame_layout.addWidget(self.url_display_frame)
+
+    def _ensure_update_frame(self):
+        """Build the update mode frame (hidden) if it doesn't exist yet"""
+        if self.update_mode_frame is not None:
+            return
+
+        self.update_mode_frame = QFrame()
+        self.update_mode_frame.setObjectName("updateModeFrame")
+        update_mode_layout = QVBoxLayout(self.update_mode_frame)
+        update_mode_layout.setContentsMargins(12, 8, 12, 8)
+        update_mode_layout.setSpacing(10)
+
+        # Original URL display (read-only)
+        original_url_header = QLabel("Scanned URL:")
+        original_url_header.setObjectName("updateUrlHeader")
+        update_mode_layout.addWidget(original_url_header)
+
+        self.update_original_url_display = QPlainTextEdit()
+        self.update_original_url_display.setObjectName("updateOriginalUrlDisplay")
+        self.update_original_url_display.setPlaceholderText("Present a tag to scan")
+        self.update_original_url_display.setReadOnly(True)
+        self.update_original_url_display.setFrameShape(QFrame.NoFrame)
+        self.update_original_url_display.setFixedHeight(64)
+        update_mode_layout.addWidget(self.update_original_url_display)
+
+        # Target URL input (editable, pre-populated with suggestion)
+        target_url_header = QLabel("New URL to write:")
+        target_url_header.setObjectName("updateUrlHeader")
+        update_mode_layout.addWidget(target_url_header)
+
+        target_input_layout = QHBoxLayout()
+        self.update_target_url_input = QLineEdit()
+        self.update_target_url_input.setPlaceholderText(
+            "Auto-suggestion will appear here, or paste your own URL..."
+        )
+        self.update_target_url_input.setObjectName("updateTargetUrlInput")
+        target_input_layout.addWidget(self.update_target_url_input, 1)
+
+        self.update_paste_btn = self._add_button(
+            target_input_layout, "Paste", "secondaryBtn",
+            "Paste URL from clipboard", self.paste_update_url,
+        )
+
+        update_mode_layout.addLayout(target_input_layout)
+
+        # Confirm button
+        confirm_layout = QHBoxLayout()
+        confirm_layout.addStretch()
+
+        self.update_confirm_btn = self._add_button(
+            confirm_layout, "Confirm & Ready to Write", "updateConfirmBtn",
+            "Write this URL to the next blank tag", self.confirm_update_write,
+        )
+        self.update_confirm_btn.setEnabled(False)
+
+        self.update_cancel_btn = self._add_button(
+            confirm_layout, "Cancel", "secondaryBtn",
+            "Discard the scanned tag and start over", self.cancel_update,
+        )
+        self.update_cancel_btn.setVisible(False)
+
+        confirm_layout.addStretch()
+        update_mode_layout.addLayout(confirm_layout)
+
+        self.update_mode_frame.setVisible(False)  # Hidden by default
+        self._mode_frame_layout.addWidget(self.update_mode_frame)
+
+    @staticmethod
+    def _repolish(widget):
+        """Re-apply stylesheet rules after a dynamic property change"""
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+    def _set_status(self, text, state):
+        """Update the header status pill
+
+        Args:
+            text: Status text to show
+            state: One of 'initializing', 'connected', 'error', 'present'
+        """
+        self.status_label.setText(text)
+        if self.status_label.property("state") != state:
+            self.status_label.setProperty("state", state)
+            self._repolish(self.status_label)
+
+    def _add_button(self, layout, text, object_name, tooltip, slot):
+        """Create a styled push button, wire its click handler and add it to layout"""
+        button = QPushButton(text)
+        button.setObjectName(object_name)
+        button.setToolTip(tooltip)
+        button.clicked.connect(slot)
+        layout.addWidget(button)
+        return button
+
+    @pyqtSlot(str, str)
+    def _queue_log_message(self, message, level):
+        """Buffer a log message from the NFC handler thread
+
+        Messages are applied together every 50 ms, so a burst costs one
+        repaint while every message (and its TTS trigger) is still handled.
+        """
+        self._pending_logs.append((message, level))
+        if not self._log_flush.isActive():
+            self._log_flush.start()
+
+    @pyqtSlot()
+    def _flush_log(self):
+        """Apply all buffered handler log messages in arrival order"""
+        pending, self._pending_logs = self._pending_logs, []
+        for message, level in pending:
+            self.log_message(message, level)
+
     def log_message(self, message, level="info"):
         """Update status message with color coding
 
@@ -914,88 +1554,73 @@ class NFCGui(QMainWindow):
             message: The message to display
             level: One of 'success', 'error', 'warning', 'info'
         """
-        # Modern color palette with subtle backgrounds
-        styles = {
-            "success": ("color: #166534; background-color: #f0fdf4;", "#22c55e"),
-            "error": ("color: #991b1b; background-color: #fef2f2;", "#ef4444"),
-            "warning": ("color: #9a3412; background-color: #fff7ed;", "#f97316"),
-            "info": ("color: #1e40af; background-color: #eff6ff;", "#3b82f6"),
-        }
-
-        style, border_color = styles.get(level, styles["info"])
-
-        self.status_message.setStyleSheet(f"""
-            QLabel {{
-                padding: 24px;
-                font-size: 15px;
-                font-weight: 500;
-                {style}
-                border-radius: 12px;
-                border: 2px solid {border_color};
-            }}
-        """)
+        # Colors come from QLabel#statusMessage[level=...] rules in _MAIN_QSS;
+        # only re-polish when the level actually changes
+        if level not in _STATUS_LEVELS:
+            level = "info"
+        if level != self._status_level:
+            self._status_level = level
+            self.status_message.setProperty("level", level)
+            self._repolish(self.status_message)
         self.status_message.setText(message)
 
         # Play TTS for error/warning messages from nfc_handler callbacks
         if level == "error" or level == "warning":
-            msg_lower = message.lower()
-            if "no url found" in msg_lower or "empty tag" in msg_lower:
-                self._play_tts("no_tag_found")
-            elif "communication error" in msg_lower:
-                self._play_tts("comm_error")
-            elif "failed to read" in msg_lower:
-                self._play_tts("read_failed")
+            phrases = [m.group().lower() for m in _STATUS_TTS_RE.finditer(message)]
+            if phrases:
+                self._play_tts(_STATUS_TTS[min(phrases, key=_STATUS_TTS_PRIORITY.get)])
 
     def initialize_nfc(self):
-        """Initialize NFC reader"""
-        try:
-            if self.nfc_handler.initialize_reader():
-                self.status_label.setText("Connected")
-                self.status_label.setStyleSheet(
-                    "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #22c55e, stop:1 #16a34a); color: white;"
-                )
-                self.log_message("Reader connected", "success")
-
-                # Start monitoring with signal emitters as callbacks (thread-safe)
-                self.nfc_handler.start_monitoring(
-                    read_callback=lambda url: self.signals.tag_read.emit(url),
-                    write_callback=lambda msg: self.signals.tag_written.emit(msg),
-                    update_callback=lambda old,
-                    new,
-                    success: self.signals.tag_updated.emit(old, new, success),
-                    log_callback=lambda msg,
-                    level="info": self.signals.log_message.emit(msg, level),
-                    outdated_callback=lambda old,
-                    new: self.signals.outdated_detected.emit(old, new),
-                    update_scan_callback=lambda orig,
-                    sugg: self.signals.update_tag_scanned.emit(orig, sugg),
-                    locked_tag_callback=lambda url: self.signals.locked_tag_with_url.emit(
-                        url
-                    ),
-                )
+        """Initialize NFC reader on a worker thread
 
-                # Start in read mode
-                self.set_read_mode()
-            else:
-                self.status_label.setText("No Reader")
-                self.status_label.setStyleSheet(
-                    "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ef4444, stop:1 #dc2626); color: white;"
-                )
-                self.log_message("No NFC reader found", "error")
-                self._play_tts("no_reader")
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "No NFC reader found.\nPlease connect ACS ACR1252 USB reader.",
-                )
-        except Exception as e:
-            self.status_label.setText("Error")
-            self.status_label.setStyleSheet(
-                "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ef4444, stop:1 #dc2626); color: white;"
+        Reader enumeration and monitor startup block on PC/SC calls, so they
+        run on a dedicated QThread. The result comes back via reader_ready.
+        """
+        self._nfc_thread = QThread(self)
+        self._nfc_worker = NFCWorker(self.nfc_handler, self.signals)
+        self._nfc_worker.moveToThread(self._nfc_thread)
+        self._nfc_thread.started.connect(self._nfc_worker.run)
+        self._nfc_worker.reader_ready.connect(self._on_reader_ready, Qt.QueuedConnection)
+        self._nfc_thread.finished.connect(self._nfc_worker.deleteLater)
+        # Stop the thread on every exit path, not just quit_application
+        QApplication.instance().aboutToQuit.connect(self._stop_nfc_thread)
+        self._nfc_thread.start()
+
+    @pyqtSlot(bool, str)
+    def _on_reader_ready(self, connected, error):
+        """Handle reader initialization result from the NFC worker thread"""
+        if connected:
+            self._set_status("Connected", "connected")
+            self.log_message("Reader connected", "success")
+
+            # Start in read mode
+            self.set_read_mode()
+        elif not error:
+            self._set_status("No Reader", "error")
+            self.log_message("No NFC reader found", "error")
+            self._play_tts("no_reader")
+            self._open_error_box(
+                "No NFC reader found.\nPlease connect ACS ACR1252 USB reader."
             )
+        else:
+            self._set_status("Error", "error")
             self.log_message("Failed to connect to reader", "error")
-            QMessageBox.critical(self, "Error", f"Failed to initialize reader:\n{e}")
-
+            self._open_error_box(f"Failed to initialize reader:\n{error}")
+
+    def _open_error_box(self, text):
+        """Show a window-modal error box without spinning a nested event loop"""
+        box = QMessageBox(QMessageBox.Critical, "Error", text, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.open()
+
+    def _stop_nfc_thread(self):
+        """Stop tag monitoring and shut down the NFC worker thread"""
+        self.nfc_handler.stop_monitoring()
+        if hasattr(self, "_nfc_thread"):
+            self._nfc_thread.quit()
+            self._nfc_thread.wait()
+
+    @_repaint_once
     def set_read_mode(self):
         """Switch to read mode"""
         self.current_mode = "read"
@@ -1011,20 +1636,23 @@ class NFCGui(QMainWindow):
         self._update_mode_indicator(self.read_btn)
 
         # Hide write-mode controls and update mode display
-        self._toggle_write_controls(False)
-        self.update_mode_frame.setVisible(False)
+        self.write_panel.setVisible(False)
+        if self.update_mode_frame is not None:
+            self.update_mode_frame.setVisible(False)
 
         # Show URL display when auto-open is disabled (copy-only mode)
         if not self.settings.auto_open_browser:
+            self._ensure_copy_url_frame()
             self.url_display_frame.setVisible(True)
-            self.copied_url_display.setText("Present a tag to copy its URL")
-        else:
+            self.copied_url_display.clear()
+        elif self.url_display_frame is not None:
             self.url_display_frame.setVisible(False)
 
         self.update_tray_icon()
         self._update_tray_mode_checks()
         self._play_tts("read_mode")
 
+    @_repaint_once
     def set_write_mode(self):
         """Switch to write mode"""
         self.current_mode = "write"
@@ -1033,9 +1661,11 @@ class NFCGui(QMainWindow):
         self._update_mode_indicator(self.write_btn)
 
         # Show write-mode controls, hide other mode displays
-        self._toggle_write_controls(True)
-        self.url_display_frame.setVisible(False)
-        self.update_mode_frame.setVisible(False)
+        self.write_panel.setVisible(True)
+        if self.url_display_frame is not None:
+            self.url_display_frame.setVisible(False)
+        if self.update_mode_frame is not None:
+            self.update_mode_frame.setVisible(False)
 
         # Auto-focus URL input for quick workflow
         self.url_input.setFocus()
@@ -1044,16 +1674,23 @@ class NFCGui(QMainWindow):
         # If there's already a URL in the input, apply it immediately
         url = self.url_input.text().strip()
         if url:
-            if not url.startswith(("http://", "https://")):
+            if not url.startswith(_URL_SCHEMES):
                 url = "https://" + url
             protection = self._get_protection_params()
-            self.nfc_handler.set_write_mode(
-                url,
-                allow_overwrite=True,
-                **protection
-            )
-            self.nfc_handler.batch_total = self.batch_spinbox.value()
-            self.nfc_handler.batch_count = 0
+            batch_total = self.batch_spinbox.value()
+            config = (url, protection, batch_total)
+            # Re-entering write mode with an unchanged setup skips
+            # reconfiguring the handler; the batch still starts over
+            handler = self.nfc_handler
+            if config != self._last_write_config or handler.mode != "write":
+                handler.set_write_mode(
+                    url,
+                    allow_overwrite=True,
+                    **protection
+                )
+                handler.batch_total = batch_total
+                self._last_write_config = config
+            handler.batch_count = 0
             self.log_message("URL ready - present tag to write", "info")
         else:
             self.log_message("Ready to write - enter URL and present tag")
@@ -1062,6 +1699,7 @@ class NFCGui(QMainWindow):
         self._update_tray_mode_checks()
         self._play_tts("ready_to_write")
 
+    @_repaint_once
     def set_update_mode(self):
         """Switch to update mode - interactive: scan tag, edit/confirm URL, write to new tag"""
         self.current_mode = "update"
@@ -1073,12 +1711,14 @@ class NFCGui(QMainWindow):
         self._update_mode_indicator(self.update_btn)
 
         # Hide write-mode controls and copy URL display
-        self._toggle_write_controls(False)
-        self.url_display_frame.setVisible(False)
+        self.write_panel.setVisible(False)
+        if self.url_display_frame is not None:
+            self.url_display_frame.setVisible(False)
 
         # Show update mode frame and reset its state
+        self._ensure_update_frame()
         self.update_mode_frame.setVisible(True)
-        self.update_original_url_display.setText("Present a tag to scan")
+        self.update_original_url_display.clear()
         self.update_target_url_input.clear()
         self.update_target_url_input.setEnabled(False)
         self.update_confirm_btn.setEnabled(False)
@@ -1089,7 +1729,7 @@ class NFCGui(QMainWindow):
         self._play_tts("update_mode")
 
     def open_settings(self):
-        """Open the settings dialog"""
+        """Open the settings dialog, building it on first use"""
         if self.settings_dialog is None or not self.settings_dialog.isVisible():
             # Get reader info
             reader_info = (
@@ -1097,120 +1737,53 @@ class NFCGui(QMainWindow):
                 if self.nfc_handler.reader
                 else "No reader connected"
             )
-            self.settings_dialog = SettingsDialog(self.settings, reader_info, self)
+            if self.settings_dialog is None:
+                self.settings_dialog = SettingsDialog(self.settings, reader_info, self)
+            else:
+                self.settings_dialog.refresh_from_settings(reader_info)
             self.settings_dialog.show()
-        else:
-            self.settings_dialog.activateWindow()
-            self.settings_dialog.raise_()
-
-    def _toggle_write_controls(self, visible):
-        """Show or hide write-mode specific controls"""
-        # URL input controls
-        self.url_label.setVisible(visible)
-        self.url_input.setVisible(visible)
-        self.paste_btn.setVisible(visible)
-
-        # Options controls
-        self.lock_radio.setVisible(visible)
-        self.password_radio.setVisible(visible)
-        self.verify_checkbox.setVisible(visible)
-
-        # Batch controls
-        self.batch_label.setVisible(visible)
-        self.batch_minus_btn.setVisible(visible)
-        self.batch_spinbox.setVisible(visible)
-        self.batch_plus_btn.setVisible(visible)
+        self.settings_dialog.raise_()
+        self.settings_dialog.activateWindow()
 
     def _update_mode_indicator(self, active_button):
-        """Update the red underline indicator on mode buttons"""
-        # Define base styles for each button (without underline)
-        button_styles = {
-            self.read_btn: """
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #22c55e, stop:1 #16a34a);
-                    color: white;
-                    min-width: 150px;
-                    padding: 12px 24px;
-                    border-radius: 8px;
-                    font-weight: 600;
-                    font-size: 14px;
-                    border: none;
-                    %s
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #16a34a, stop:1 #15803d);
-                }
-            """,
-            self.write_btn: """
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #3b82f6, stop:1 #2563eb);
-                    color: white;
-                    min-width: 150px;
-                    padding: 12px 24px;
-                    border-radius: 8px;
-                    font-weight: 600;
-                    font-size: 14px;
-                    border: none;
-                    %s
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #2563eb, stop:1 #1d4ed8);
-                }
-            """,
-            self.update_btn: """
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #a855f7, stop:1 #9333ea);
-                    color: white;
-                    min-width: 150px;
-                    padding: 12px 24px;
-                    border-radius: 8px;
-                    font-weight: 600;
-                    font-size: 14px;
-                    border: none;
-                    %s
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #9333ea, stop:1 #7e22ce);
-                }
-            """,
-        }
+        """Update the red underline indicator on mode buttons
 
-        # Red underline style
-        underline = "border-bottom: 3px solid #ef4444;"
+        Only the previously active and newly active buttons are restyled,
+        using stylesheets formatted once in init_ui.
+        """
+        previous = self._active_mode_btn
+        if active_button is previous:
+            return
 
-        for btn, style_template in button_styles.items():
-            if btn == active_button:
-                btn.setStyleSheet(style_template % underline)
-            else:
-                btn.setStyleSheet(style_template % "")
+        if previous is None:
+            # First call: give every other mode button its inactive style
+            for btn, style in self._mode_btn_inactive_qss.items():
+                if btn is not active_button:
+                    btn.setStyleSheet(style)
+        else:
+            previous.setStyleSheet(self._mode_btn_inactive_qss[previous])
+
+        active_button.setStyleSheet(self._mode_btn_active_qss[active_button])
+        self._active_mode_btn = active_button
 
     def paste_url(self):
         """Paste URL from clipboard and prepare for writing"""
-        try:
-            clipboard_content = pyperclip.paste().strip()
-            if clipboard_content:
-                # Clean URL: strip any characters before http:// or https://
-                # This handles cases where stray characters get prepended
-                clipboard_content = self._clean_url(clipboard_content)
-
-                # Switch to write mode if not already
-                if self.current_mode != "write":
-                    self.set_write_mode()
-
-                self.url_input.setText(clipboard_content)
-                # _on_url_changed will handle updating the handler and TTS
-            else:
-                self.log_message("Clipboard is empty", "warning")
-                QMessageBox.warning(self, "Warning", "Clipboard is empty")
-        except Exception as e:
-            self.log_message("Failed to paste from clipboard", "error")
-            QMessageBox.critical(self, "Error", f"Failed to paste from clipboard:\n{e}")
+        # In-process clipboard, cannot fail like a helper subprocess
+        clipboard_content = self._clipboard.text().strip()
+        if clipboard_content:
+            # Clean URL: strip any characters before http:// or https://
+            # This handles cases where stray characters get prepended
+            clipboard_content = self._clean_url(clipboard_content)
+
+            # Switch to write mode if not already
+            if self.current_mode != "write":
+                self.set_write_mode()
+
+            self.url_input.setText(clipboard_content)
+            # _on_url_changed will handle updating the handler and TTS
+        else:
+            self.log_message("Clipboard is empty", "warning")
+            QMessageBox.warning(self, "Warning", "Clipboard is empty")
 
     def _clean_url(self, url: str) -> str:
         """Clean URL by removing any characters before http:// or https://
@@ -1222,24 +1795,25 @@ class NFCGui(QMainWindow):
         if not url:
             return url
 
-        # If URL already starts correctly, return as-is
-        if url.startswith(('http://', 'https://')):
-            return url
-
-        # Look for http:// or https:// anywhere in the string
-        for prefix in ('https://', 'http://'):
-            pos = url.find(prefix)
-            if pos > 0:
-                # Found the prefix after some stray characters - strip them
-                cleaned = url[pos:]
-                return cleaned
+        # Single scan for http:// or https:// anywhere in the string; strip
+        # any stray characters in front of it
+        match = self._URL_PREFIX_RE.search(url)
+        if match and match.start() > 0:
+            return url[match.start():]
 
-        # No http prefix found - return original (https:// will be added later)
+        # Already starts correctly, or no http prefix found (https:// will
+        # be added later) - return as-is
         return url
 
     def _on_url_changed(self, url: str):
-        """Handle URL text changes - auto-update write mode configuration"""
-        url = url.strip()
+        """Handle URL text changes - defer to _apply_pending_url"""
+        self._pending_url = url
+        self._url_debounce.start()
+
+    @pyqtSlot()
+    def _apply_pending_url(self):
+        """Auto-update write mode configuration with the latest URL"""
+        url = self._pending_url.strip()
         if not url:
             return
 
@@ -1248,11 +1822,12 @@ class NFCGui(QMainWindow):
             return
 
         # Add https:// if not present
-        if not url.startswith(("http://", "https://")):
+        if not url.startswith(_URL_SCHEMES):
             url = "https://" + url
 
         # Update the NFC handler with new URL
         protection = self._get_protection_params()
+        self._last_write_config = None
         self.nfc_handler.set_write_mode(
             url,
             allow_overwrite=True,
@@ -1270,32 +1845,40 @@ class NFCGui(QMainWindow):
         self.log_message("URL updated - present tag to write", "info")
 
     def _on_batch_changed(self, count: int):
-        """Handle batch count changes - auto-update write mode configuration"""
+        """Handle batch count changes - defer to _apply_pending_batch"""
+        self._pending_batch = count
+        self._batch_debounce.start()
+
+    @pyqtSlot()
+    def _apply_pending_batch(self):
+        """Auto-update write mode configuration with the latest batch count"""
+        count = self._pending_batch
         if self.current_mode != "write":
             return
 
+        self._last_write_config = None
         self.nfc_handler.batch_total = count
         self.nfc_handler.batch_count = 0
 
         # Show/hide progress indicator based on batch count
-        if count > 1:
-            self.progress_group.setVisible(True)
-            self.progress_label.setText(f"Tag 0 of {count}")
-            self.progress_bar.setValue(0)
-        else:
-            self.progress_group.setVisible(False)
-
-    def _decrease_batch(self):
-        """Decrease batch count by 1"""
-        current = self.batch_spinbox.value()
-        if current > self.batch_spinbox.minimum():
-            self.batch_spinbox.setValue(current - 1)
-
-    def _increase_batch(self):
-        """Increase batch count by 1"""
-        current = self.batch_spinbox.value()
-        if current < self.batch_spinbox.maximum():
-            self.batch_spinbox.setValue(current + 1)
+        self.progress_group.setUpdatesEnabled(False)
+        try:
+            if count > 1:
+                self.progress_group.setVisible(True)
+                self._show_batch_progress(0, count)
+            else:
+                self.progress_group.setVisible(False)
+        finally:
+            self.progress_group.setUpdatesEnabled(True)
+
+    def _show_batch_progress(self, done, total):
+        """Show batch progress, skipping the widget writes if nothing changed"""
+        progress = (done, total)
+        if progress == self._shown_progress:
+            return
+        self._shown_progress = progress
+        self.progress_bar.setValue(done * 100 // total)
+        self.progress_label.setText(f"Tag {done} of {total}")
 
     def _get_protection_params(self):
         """Get protection parameters based on UI selection"""
@@ -1331,11 +1914,12 @@ class NFCGui(QMainWindow):
         if not url:
             return
 
-        if not url.startswith(("http://", "https://")):
+        if not url.startswith(_URL_SCHEMES):
             url = "https://" + url
 
         # Update the handler with new options
         protection = self._get_protection_params()
+        self._last_write_config = None
         self.nfc_handler.set_write_mode(
             url,
             allow_overwrite=True,
@@ -1356,13 +1940,14 @@ class NFCGui(QMainWindow):
             return
 
         # Add https:// if not present
-        if not url.startswith(("http://", "https://")):
+        if not url.startswith(_URL_SCHEMES):
             url = "https://" + url
 
         batch_count = self.batch_spinbox.value()
 
         # Set write mode
         protection = self._get_protection_params()
+        self._last_write_config = None
         self.nfc_handler.set_write_mode(
             url,
             allow_overwrite=True,
@@ -1376,8 +1961,7 @@ class NFCGui(QMainWindow):
         # Show/update progress indicator for batch operations
         if batch_count > 1:
             self.progress_group.setVisible(True)
-            self.progress_label.setText(f"Tag 0 of {batch_count}")
-            self.progress_bar.setValue(0)
+            self._show_batch_progress(0, batch_count)
             self.log_message(f"Present tag 1 of {batch_count}")
         else:
             self.progress_group.setVisible(False)
@@ -1389,11 +1973,8 @@ class NFCGui(QMainWindow):
         self.last_url = url
         self._play_beep("read")  # Short beep for successful read
 
-        # Copy to clipboard
-        try:
-            pyperclip.copy(url)
-        except Exception:
-            pass
+        # Copy to clipboard (in-process, cannot fail like a helper subprocess)
+        self._clipboard.setText(url)
 
         if self.settings.auto_open_browser:
             # Auto-open mode: open in browser
@@ -1402,38 +1983,46 @@ class NFCGui(QMainWindow):
             self._open_in_browser(url)
         else:
             # Copy-only mode: display URL and copy to clipboard, don't open browser
-            self.copied_url_display.setText(url)
+            self._ensure_copy_url_frame()
+            self.copied_url_display.setPlainText(url)
             self.log_message("URL copied to clipboard", "success")
             self._play_tts("url_copied")  # Voice announcement for copy mode
 
     @pyqtSlot(str)
     def on_tag_written(self, message):
         """Handle tag write event (thread-safe slot)"""
+        msg_lower = message.lower()
+
         # Check for locked tag prevention first (must come before general "locked" check)
-        is_locked_prevention = "writing prevented" in message.lower()
-        is_locked_detected = "locked tag detected" in message.lower()
+        is_locked_prevention = "writing prevented" in msg_lower
+        is_locked_detected = "locked tag detected" in msg_lower
         is_success = "Written" in message and not is_locked_prevention
 
         if is_success:
             # Parse verification status
-            is_verified = "verified" in message.lower() and "failed" not in message.lower()
-            verification_failed = "verification failed" in message.lower()
+            is_verified = "verified" in msg_lower and "failed" not in msg_lower
+            verification_failed = "verification failed" in msg_lower
 
             # Build status message
-            if "locked" in message.lower() and "prevention" not in message.lower():
+            if "locked" in msg_lower and "prevention" not in msg_lower:
                 if is_verified:
-                    self.log_message("Tag written, locked & verified", "success")
+                    status = ("Tag written, locked & verified", "success")
                 elif verification_failed:
-                    self.log_message("Tag written & locked (verification failed)", "warning")
+                    status = ("Tag written & locked (verification failed)", "warning")
                 else:
-                    self.log_message("Tag written and locked", "success")
+                    status = ("Tag written and locked", "success")
             else:
                 if is_verified:
-                    self.log_message("Tag written & verified", "success")
+                    status = ("Tag written & verified", "success")
                 elif verification_failed:
-                    self.log_message("Tag written (verification failed)", "warning")
+                    status = ("Tag written (verification failed)", "warning")
                 else:
-                    self.log_message("Tag written", "success")
+                    status = ("Tag written", "success")
+
+            # In a batch the progress update below replaces this message
+            # straight away, so only show it for single writes
+            if self.nfc_handler.batch_total <= 1:
+                self.log_message(*status)
 
             # Play TTS - use verified sound if verification passed
             if is_verified:
@@ -1449,7 +2038,7 @@ class NFCGui(QMainWindow):
                 # Legacy message or edge case
                 self.log_message("Locked tag - writing prevented", "error")
                 self._play_tts("locked_write_prevented")
-            elif "existing data" in message.lower() or "blocked" in message.lower():
+            elif "existing data" in msg_lower or "blocked" in msg_lower:
                 self.log_message("Write blocked: tag has existing data", "error")
                 self._play_tts("tag_has_data")
             else:
@@ -1460,34 +2049,36 @@ class NFCGui(QMainWindow):
 
         # Update batch progress only on success
         if self.nfc_handler.batch_total > 1 and is_success:
-            # Update progress bar and label
-            progress_percentage = int(
-                (self.nfc_handler.batch_count / self.nfc_handler.batch_total) * 100
-            )
-            self.progress_bar.setValue(progress_percentage)
-            self.progress_label.setText(
-                f"Tag {self.nfc_handler.batch_count} of {self.nfc_handler.batch_total}"
-            )
-
-            if self.nfc_handler.batch_count < self.nfc_handler.batch_total:
-                self.log_message(
-                    f"Present tag {self.nfc_handler.batch_count + 1} of {self.nfc_handler.batch_total}"
-                )
-            else:
-                self.log_message("All tags written", "success")
-                self.progress_group.setVisible(False)  # Hide progress after completion
-                self._play_tts(
-                    "batch_finished"
-                )  # Voice announcement for batch complete
-                # Reset batch counter for next batch session
-                self.nfc_handler.batch_count = 0
-                self.progress_bar.setValue(0)
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Successfully wrote {self.nfc_handler.batch_total} tags",
+            # Suspend painting so the progress and status writes land in
+            # a single repaint
+            self.progress_group.setUpdatesEnabled(False)
+            try:
+                # Update progress bar and label
+                self._show_batch_progress(
+                    self.nfc_handler.batch_count, self.nfc_handler.batch_total
                 )
 
+                if self.nfc_handler.batch_count < self.nfc_handler.batch_total:
+                    self.log_message(
+                        f"Present tag {self.nfc_handler.batch_count + 1} of {self.nfc_handler.batch_total}"
+                    )
+                else:
+                    # Report completion in the status panel rather than a modal
+                    # box, so tag events keep flowing during the next batch
+                    self.log_message(
+                        f"All tags written - successfully wrote {self.nfc_handler.batch_total} tags",
+                        "success",
+                    )
+                    self.progress_group.setVisible(False)  # Hide progress after completion
+                    self._play_tts(
+                        "batch_finished"
+                    )  # Voice announcement for batch complete
+                    # Reset batch counter for next batch session
+                    self.nfc_handler.batch_count = 0
+                    self._show_batch_progress(0, self.nfc_handler.batch_total)
+            finally:
+                self.progress_group.setUpdatesEnabled(True)
+
     @pyqtSlot(str, str)
     def on_outdated_detected(self, old_url, new_url):
         """Handle outdated tag detected event (step 1 of update mode)"""
@@ -1496,10 +2087,7 @@ class NFCGui(QMainWindow):
         self.log_message("Outdated tag detected - present new blank tag", "success")
 
         # Update status to show we're waiting for a new tag
-        self.status_label.setText("PRESENT NEW TAG")
-        self.status_label.setStyleSheet(
-            "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f97316, stop:1 #ea580c); color: white;"
-        )
+        self._set_status("PRESENT NEW TAG", "present")
 
     @pyqtSlot(str, str, bool)
     def on_tag_updated(self, old_url, new_url, success):
@@ -1511,11 +2099,8 @@ class NFCGui(QMainWindow):
             self._play_tts("tag_updated")  # Voice announcement
 
             # Reset UI for next update
-            self.status_label.setText("Connected")
-            self.status_label.setStyleSheet(
-                "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #22c55e, stop:1 #16a34a); color: white;"
-            )
-            self.update_original_url_display.setText("Present a tag to scan")
+            self._set_status("Connected", "connected")
+            self.update_original_url_display.clear()
             self.update_target_url_input.clear()
             self.update_target_url_input.setEnabled(False)
             self.update_confirm_btn.setEnabled(False)
@@ -1536,7 +2121,7 @@ class NFCGui(QMainWindow):
         self._play_beep("read")  # Acknowledge the scan
 
         # Display the original URL
-        self.update_original_url_display.setText(original_url)
+        self.update_original_url_display.setPlainText(original_url)
 
         # Pre-populate target input with suggestion (if available)
         if suggested_url:
@@ -1577,17 +2162,14 @@ class NFCGui(QMainWindow):
 
     def paste_update_url(self):
         """Paste URL from clipboard into update target input"""
-        try:
-            clipboard_content = pyperclip.paste().strip()
-            if clipboard_content:
-                # Clean URL: strip any stray characters before http://
-                clipboard_content = self._clean_url(clipboard_content)
-                self.update_target_url_input.setText(clipboard_content)
-                self.update_target_url_input.setFocus()
-            else:
-                self.log_message("Clipboard is empty", "warning")
-        except Exception as e:
-            self.log_message("Failed to paste from clipboard", "error")
+        clipboard_content = self._clipboard.text().strip()
+        if clipboard_content:
+            # Clean URL: strip any stray characters before http://
+            clipboard_content = self._clean_url(clipboard_content)
+            self.update_target_url_input.setText(clipboard_content)
+            self.update_target_url_input.setFocus()
+        else:
+            self.log_message("Clipboard is empty", "warning")
 
     def confirm_update_write(self):
         """Confirm the target URL and prepare to write to new tag"""
@@ -1598,21 +2180,18 @@ class NFCGui(QMainWindow):
             return
 
         # Add https:// if not present
-        if not target_url.startswith(("http://", "https://")):
+        if not target_url.startswith(_URL_SCHEMES):
             target_url = "https://" + target_url
             self.update_target_url_input.setText(target_url)
 
         # Store the confirmed URL and advance handler to write step
-        original_url = self.update_original_url_display.text()
+        original_url = self.update_original_url_display.toPlainText()
         self.nfc_handler.pending_original_url = original_url
         self.nfc_handler.pending_rewrite_url = target_url
         self.nfc_handler.update_step = "write_new"
 
         # Update UI to show we're ready for new tag
-        self.status_label.setText("PRESENT NEW TAG")
-        self.status_label.setStyleSheet(
-            "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f97316, stop:1 #ea580c); color: white;"
-        )
+        self._set_status("PRESENT NEW TAG", "present")
         self.log_message("Present a blank tag to write", "info")
         self._play_tts("present_tag")
 
@@ -1625,11 +2204,8 @@ class NFCGui(QMainWindow):
         self.nfc_handler.cancel_pending_update()
 
         # Reset UI
-        self.status_label.setText("Connected")
-        self.status_label.setStyleSheet(
-            "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #22c55e, stop:1 #16a34a); color: white;"
-        )
-        self.update_original_url_display.setText("Present a tag to scan")
+        self._set_status("Connected", "connected")
+        self.update_original_url_display.clear()
         self.update_target_url_input.clear()
         self.update_target_url_input.setEnabled(False)
         self.update_confirm_btn.setEnabled(False)
@@ -1639,14 +2215,8 @@ class NFCGui(QMainWindow):
     def copy_last_url(self):
         """Copy last URL to clipboard"""
         if self.last_url:
-            try:
-                pyperclip.copy(self.last_url)
-                self.log_message("URL copied to clipboard", "success")
-            except Exception as e:
-                self.log_message("Failed to copy to clipboard", "error")
-                QMessageBox.critical(
-                    self, "Error", f"Failed to copy to clipboard:\n{e}"
-                )
+            self._clipboard.setText(self.last_url)
+            self.log_message("URL copied to clipboard", "success")
         else:
             self.log_message("No URL to copy - read a tag first", "warning")
             QMessageBox.warning(self, "Warning", "No URL to copy - read a tag first")
@@ -1659,29 +2229,24 @@ class NFCGui(QMainWindow):
             QMessageBox.warning(self, "Warning", "No URL to open - read a tag first")
 
     def _open_in_browser(self, url: str):
-        """Open URL in Chrome (or fallback browser)"""
-        try:
-            subprocess.Popen(
-                ["google-chrome", url],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+        """Open URL in Chrome (or fallback browser) from a pool thread"""
+        if self._browser_argv is None:
+            if not QDesktopServices.openUrl(QUrl(url)):
+                self.log_message("Failed to open browser", "error")
+            return
+
+        QThreadPool.globalInstance().start(
+            _SpawnProcess(
+                self._browser_argv + [url],
+                new_session=True,
+                on_error=self._browser_failed,
             )
-        except FileNotFoundError:
-            try:
-                subprocess.Popen(
-                    ["chromium-browser", url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            except FileNotFoundError:
-                try:
-                    subprocess.Popen(
-                        ["xdg-open", url],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-                except Exception as e:
-                    self.log_message(f"Failed to open browser: {e}", "error")
+        )
+
+    def _browser_failed(self, error):
+        """Report a failed browser launch (called from a pool thread)"""
+        # Queued signal hops back to the GUI thread
+        self.signals.log_message.emit(f"Failed to open browser: {error}", "error")
 
     def _play_beep(self, beep_type: str = "success"):
         """Play a confirmation beep sound
@@ -1691,134 +2256,105 @@ class NFCGui(QMainWindow):
                        "write" for two-tone success beep,
                        "error" for error sound
         """
-        try:
-            if beep_type == "read":
-                # Single short beep for successful read
-                sound = "/usr/share/sounds/freedesktop/stereo/message.oga"
-                if os.path.exists(sound):
-                    subprocess.Popen(
-                        ["paplay", sound],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-            elif beep_type == "write":
-                # Two-tone success beep for write & lock
-                sound1 = "/usr/share/sounds/freedesktop/stereo/message.oga"
-                sound2 = "/usr/share/sounds/freedesktop/stereo/complete.oga"
-                if os.path.exists(sound1) and os.path.exists(sound2):
-                    subprocess.Popen(
-                        ["paplay", sound1],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-                    subprocess.Popen(
-                        ["bash", "-c", f"sleep 0.15 && paplay {sound2}"],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-            elif beep_type == "error":
-                sound = "/usr/share/sounds/freedesktop/stereo/dialog-error.oga"
-                if os.path.exists(sound):
-                    subprocess.Popen(
-                        ["paplay", sound],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-        except Exception:
-            pass
-
-    def _play_tts(self, announcement: str):
+        _, beeps = _get_sounds()
+        if beep_type == "read":
+            # Single short beep for successful read
+            self._play_sound(beeps.get("message"))
+        elif beep_type == "write":
+            # Two-tone success beep for write & lock; the second tone is
+            # scheduled on the event loop instead of a sleeping shell
+            if "message" in beeps and "complete" in beeps:
+                self._play_sound(beeps["message"])
+                QTimer.singleShot(150, self._play_write_tone2)
+        elif beep_type == "error":
+            self._play_sound(beeps.get("dialog-error"))
+
+    def _play_write_tone2(self):
+        """Play the second tone of the write success beep"""
+        self._play_sound(_get_sounds()[1].get("complete"))
+
+    def _play_tts(self, announcement: str, on_done=None):
         """Play a TTS voice announcement
 
         Args:
             announcement: One of "tag_opened", "tag_written", "batch_started", "batch_finished"
+            on_done: See _play_sound
         """
-        if not self.settings.tts_enabled:
-            return
+        path = _get_sounds()[0].get(announcement) if self.settings.tts_enabled else None
+        self._play_sound(path, on_done)
 
-        try:
-            # Get the sounds directory relative to this module
-            sounds_dir = os.path.join(os.path.dirname(__file__), "sounds")
-            sound_file = os.path.join(sounds_dir, f"{announcement}.ogg")
+    @staticmethod
+    def _play_sound(path, on_done=None):
+        """Play a cached sound file, ignoring missing ones
 
-            if os.path.exists(sound_file):
-                subprocess.Popen(
-                    ["paplay", sound_file],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
+        Uses libcanberra in-process when available, otherwise starts paplay
+        from the thread pool (if it is installed).
+
+        Args:
+            path: Sound file, or None for nothing to play
+            on_done: Called, possibly from another thread, once the sound
+                     no longer needs this process: in-process playback has
+                     ended, paplay has been started, or nothing was played
+        """
+        if path:
+            player = _get_canberra()
+            if player is not None and player.play(path, on_done):
+                return
+            if _PAPLAY is not None:
+                QThreadPool.globalInstance().start(
+                    _SpawnProcess([_PAPLAY, path], on_launched=on_done)
                 )
-        except Exception:
-            pass
+                return
+        if on_done is not None:
+            on_done()
+
+    def _ensure_tray_initialised(self):
+        """Setup system tray icon and menu on first use
+
+        Most sessions never minimise, so the icon, menu and actions are not
+        built at startup.
+        """
+        if self.tray_icon is not None:
+            return
+
+        # Menu classes are only needed here, so import them on first use
+        from PyQt5.QtWidgets import QMenu, QAction
 
-    def setup_system_tray(self):
-        """Setup system tray icon and menu"""
         # Create system tray icon
         self.tray_icon = QSystemTrayIcon(self)
 
         # Create a simple icon (colored circle)
-        icon = self.create_tray_icon()
-        self.tray_icon.setIcon(QIcon(icon))
+        self.tray_icon.setIcon(self._tray_icon())
 
-        # Create tray menu
+        # Create tray menu from the _TRAY_ACTIONS table
         tray_menu = QMenu()
-
-        # Show/Hide window action
-        show_action = QAction("Show Window", self)
-        show_action.triggered.connect(self.show_window)
-        tray_menu.addAction(show_action)
-
-        hide_action = QAction("Minimize to Tray", self)
-        hide_action.triggered.connect(self.hide_to_tray)
-        tray_menu.addAction(hide_action)
-
-        tray_menu.addSeparator()
-
-        # Mode selection actions
-        self.tray_read_action = QAction("Read Mode", self)
-        self.tray_read_action.setCheckable(True)
-        self.tray_read_action.setChecked(True)  # Default mode
-        self.tray_read_action.triggered.connect(self._tray_set_read_mode)
-        tray_menu.addAction(self.tray_read_action)
-
-        self.tray_write_action = QAction("Write Mode", self)
-        self.tray_write_action.setCheckable(True)
-        self.tray_write_action.triggered.connect(self._tray_set_write_mode)
-        tray_menu.addAction(self.tray_write_action)
-
-        self.tray_update_action = QAction("Update Mode", self)
-        self.tray_update_action.setCheckable(True)
-        self.tray_update_action.triggered.connect(self._tray_set_update_mode)
-        tray_menu.addAction(self.tray_update_action)
+        for item in _TRAY_ACTIONS:
+            if item is None:
+                tray_menu.addSeparator()
+                continue
+            label, slot, attr, checkable = item
+            action = QAction(label, self)
+            action.setCheckable(checkable)
+            action.triggered.connect(getattr(self, slot))
+            tray_menu.addAction(action)
+            if attr:
+                setattr(self, attr, action)
 
         # Group mode actions for exclusive selection
         self.tray_mode_group = [self.tray_read_action, self.tray_write_action, self.tray_update_action]
 
-        tray_menu.addSeparator()
-
-        # Background read mode toggle
-        self.background_read_action = QAction("Background Read Mode", self)
-        self.background_read_action.setCheckable(True)
-        self.background_read_action.setChecked(False)
-        self.background_read_action.triggered.connect(self.toggle_background_read)
-        tray_menu.addAction(self.background_read_action)
-
-        tray_menu.addSeparator()
-
-        # Quit action
-        quit_action = QAction("Quit", self)
-        quit_action.triggered.connect(self.quit_application)
-        tray_menu.addAction(quit_action)
-
         self.tray_icon.setContextMenu(tray_menu)
 
         # Double-click to show window
         self.tray_icon.activated.connect(self.tray_icon_activated)
 
+        # Reflect the mode chosen before the tray existed
+        self._update_tray_mode_checks()
+        self.update_tray_icon()
+
         # Show the tray icon
         self.tray_icon.show()
 
-        self.tray_icon.setToolTip("NFC Reader/Writer - Ready")
-
     def _update_tray_mode_checks(self):
         """Update the checked state of tray mode actions"""
         if hasattr(self, 'tray_mode_group'):
@@ -1841,46 +2377,35 @@ class NFCGui(QMainWindow):
         self.set_update_mode()
         self._update_tray_mode_checks()
 
+    def _tray_icon(self, mode: str = "read") -> QIcon:
+        """Return the cached tray QIcon for a mode, building it on first use"""
+        icon = _ICON_CACHE.get(mode)
+        if icon is None:
+            icon = _ICON_CACHE[mode] = QIcon(self.create_tray_icon(mode))
+        return icon
+
     def create_tray_icon(self, mode: str = "read"):
         """Create tray icon based on current mode
 
         Args:
             mode: One of "read", "write", "update"
         """
-        # Get the assets directory relative to this module
-        assets_dir = os.path.join(os.path.dirname(__file__), "..", "assets")
-
-        # Map mode to icon file
-        icon_files = {
-            "read": "tray-read.svg",
-            "write": "tray-write.svg",
-            "update": "tray-update.svg",
-        }
+        icon_file = os.path.join(_ASSETS_DIR, _TRAY_ICON_FILES.get(mode, "tray-read.svg"))
 
-        icon_file = os.path.join(assets_dir, icon_files.get(mode, "tray-read.svg"))
-
-        # Try to load the SVG icon
-        if os.path.exists(icon_file):
-            pixmap = QPixmap(icon_file)
-            if not pixmap.isNull():
-                return pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Try to load the SVG icon (a missing file just gives a null pixmap)
+        pixmap = QPixmap(icon_file)
+        if not pixmap.isNull():
+            return pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
         # Fallback to colored circle if SVG loading fails
         pixmap = QPixmap(64, 64)
         pixmap.fill(Qt.transparent)
 
-        from PyQt5.QtGui import QPainter, QColor
-
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Color based on mode
-        colors = {
-            "read": QColor(34, 197, 94),    # Green
-            "write": QColor(59, 130, 246),  # Blue
-            "update": QColor(168, 85, 247), # Purple
-        }
-        painter.setBrush(colors.get(mode, QColor(34, 197, 94)))
+        painter.setBrush(QColor(*(_TRAY_ICON_COLORS.get(mode) or _TRAY_ICON_COLORS["read"])))
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(4, 4, 56, 56)
 
@@ -1889,9 +2414,8 @@ class NFCGui(QMainWindow):
 
     def update_tray_icon(self):
         """Update tray icon to reflect current mode"""
-        if hasattr(self, 'tray_icon') and self.tray_icon:
-            icon = self.create_tray_icon(self.current_mode)
-            self.tray_icon.setIcon(QIcon(icon))
+        if self.tray_icon is not None:
+            self.tray_icon.setIcon(self._tray_icon(self.current_mode))
 
             # Update tooltip
             mode_names = {
@@ -1923,7 +2447,6 @@ class NFCGui(QMainWindow):
 
         # On Wayland/KDE, we may need to call these again after a brief delay
         # to ensure the window manager processes the request
-        from PyQt5.QtCore import QTimer
         QTimer.singleShot(50, self._ensure_window_visible)
 
     def _ensure_window_visible(self):
@@ -1933,6 +2456,7 @@ class NFCGui(QMainWindow):
 
     def hide_to_tray(self):
         """Minimize window to system tray"""
+        self._ensure_tray_initialised()
         self.hide()
         self.tray_icon.showMessage(
             "NFC Reader/Writer",
@@ -1943,15 +2467,30 @@ class NFCGui(QMainWindow):
 
     def enable_background_mode(self):
         """Enable background read mode from main window button"""
+        self._ensure_tray_initialised()
         self.background_read_action.setChecked(True)
         self.toggle_background_read(True)
 
     def toggle_background_read(self, checked):
         """Toggle background read mode"""
+        self._ensure_tray_initialised()
         if checked:
             # Enable background read mode
             self.set_read_mode()
             self.hide_to_tray()
+            self.log_message("Background mode active", "success")
+            self._play_tts("background_mode")  # Voice announcement
+        else:
+            # Disable background read mode
+            self.log_message("Background mode off")
+
+        self._pending_tray_state = checked
+        self._tray_state_timer.start()
+
+    @pyqtSlot()
+    def _apply_pending_tray_state(self):
+        """Update the tray tooltip and notification for the settled background mode"""
+        if self._pending_tray_state:
             self.tray_icon.setToolTip("NFC Reader/Writer - Background Read Mode Active")
             self.tray_icon.showMessage(
                 "Background Read Mode",
@@ -1959,10 +2498,7 @@ class NFCGui(QMainWindow):
                 QSystemTrayIcon.Information,
                 3000,
             )
-            self.log_message("Background mode active", "success")
-            self._play_tts("background_mode")  # Voice announcement
         else:
-            # Disable background read mode
             self.tray_icon.setToolTip("NFC Reader/Writer - Ready")
             self.tray_icon.showMessage(
                 "Background Read Mode",
@@ -1970,7 +2506,6 @@ class NFCGui(QMainWindow):
                 QSystemTrayIcon.Information,
                 2000,
             )
-            self.log_message("Background mode off")
 
     def quit_application(self):
         """Quit the application completely"""
@@ -1983,17 +2518,24 @@ class NFCGui(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
-            self._play_tts("closing")  # Farewell announcement
-            self.nfc_handler.stop_monitoring()
-            self.tray_icon.hide()
-            # Brief delay to let the TTS play
-            from PyQt5.QtCore import QTimer
-
-            QTimer.singleShot(1500, QApplication.quit)
+            # Farewell announcement; quit once it has played in-process or its
+            # paplay child is running (it keeps playing after we exit)
+            self._play_tts("closing", on_done=self._request_quit)
+            self._stop_nfc_thread()
+            if self.tray_icon is not None:
+                self.tray_icon.hide()
+            # In case the sound server never reports back
+            QTimer.singleShot(5000, QApplication.quit)
+
+    @staticmethod
+    def _request_quit():
+        """Quit the application; safe to call from any thread"""
+        QMetaObject.invokeMethod(QApplication.instance(), "quit", Qt.QueuedConnection)
 
     def closeEvent(self, event):
         """Handle window close event - minimize to tray instead of closing"""
-        if self.tray_icon.isVisible():
+        # The tray may not be built yet; minimise whenever a tray is available
+        if QSystemTrayIcon.isSystemTrayAvailable():
             event.ignore()
             self.hide_to_tray()
         else:
@@ -2005,6 +2547,7 @@ def main():
     """Main entry point"""
     app = QApplication(sys.argv)
     app.setStyle("Fusion")  # Modern cross-platform style
+    app.setStyleSheet(_MAIN_QSS)  # Parsed once per process, not per window
     window = NFCGui()
     window.show()
     sys.exit(app.exec_())
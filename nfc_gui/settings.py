@@ -7,7 +7,84 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Pattern
+
+try:
+    # Optional linear-time engine, immune to catastrophic backtracking
+    import re2
+except ImportError:
+    re2 = None
+
+
+def compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile a rewrite pattern, preferring re2 when it is installed.
+
+    Falls back to the standard re module for patterns re2 rejects
+    (e.g. lookarounds or backreferences).
+
+    Raises:
+        re.error: If the pattern is not a valid regex
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+_REGEX_META = frozenset(".^$*+?()[]{}|\\")
+_ITEM_TAIL = "(.+)$"
+
+
+def literal_prefix(pattern: str) -> Optional[str]:
+    """Return the prefix of a '^<literal>(.+)$' pattern, or None for other shapes.
+
+    Backslash-escaped punctuation (e.g. '\\.') counts as literal; any other
+    regex syntax in the prefix disqualifies the pattern.
+    """
+    if not (pattern.startswith('^') and pattern.endswith(_ITEM_TAIL)):
+        return None
+
+    chars = []
+    escaped = False
+    for ch in pattern[1:-len(_ITEM_TAIL)]:
+        if escaped:
+            # \d, \w, \1 etc. are classes or backreferences, not literals
+            if ch.isalnum() or ch == '_':
+                return None
+            chars.append(ch)
+            escaped = False
+        elif ch == '\\':
+            escaped = True
+        elif ch in _REGEX_META:
+            return None
+        else:
+            chars.append(ch)
+    return None if escaped else ''.join(chars)
+
+
+def match_item_id(pattern: Pattern[str], prefix: Optional[str], url: str) -> Optional[str]:
+    """Return the item ID captured from url, or None if the pattern doesn't match.
+
+    When the pattern reduced to a literal prefix (see literal_prefix), a plain
+    startswith + slice answers without running the regex engine.
+    """
+    if prefix is not None:
+        if not url.startswith(prefix):
+            return None
+        item_id = url[len(prefix):]
+        # '.' stops at newlines, so leave those rare inputs to the regex
+        if item_id and '\n' not in item_id:
+            return item_id
+
+    match = pattern.match(url)
+    return match.group(1) if match else None
+
+
+def normalize_target_base(target: str) -> str:
+    """Return the target base URL with exactly one trailing '/'."""
+    return target.rstrip('/') + '/'
 
 
 class Settings:
@@ -29,6 +106,13 @@ class Settings:
         self.verify_after_write: bool = True  # Verify writes by reading back and comparing
         self.use_password_protection: bool = False  # False = permanent lock, True = password protection
         self.tag_password: str = ""  # 4-character password for NTAG password protection
+        # (source string, compiled pattern, literal_prefix()) for the current
+        # rule; replaced as one tuple so the monitor thread never mixes
+        # fields from two different patterns
+        self._rule: Tuple[Optional[str], Optional[Pattern[str]], Optional[str]] = (None, None, None)
+        # (target_base_url, normalized target base), replaced as one tuple
+        # for the same reason as _rule
+        self._target: Tuple[Optional[str], str] = (None, "")
         self.load()
 
     def load(self) -> None:
@@ -68,10 +152,47 @@ class Settings:
         except IOError:
             return False
 
-    def set_rewrite_rule(self, pattern: str, target: str) -> None:
-        """Set the URL rewrite rule."""
+    def set_rewrite_rule(self, pattern: str, target: str,
+                         compiled: Optional[Pattern[str]] = None,
+                         target_base: Optional[str] = None) -> None:
+        """Set the URL rewrite rule.
+
+        Args:
+            pattern: Source URL regex
+            target: Target base URL
+            compiled: Already-compiled pattern, reused to skip recompiling
+            target_base: Already-normalized target (see normalize_target_base)
+        """
         self.source_pattern = pattern
         self.target_base_url = target
+        if compiled is not None and compiled.pattern == pattern:
+            self._rule = (pattern, compiled, literal_prefix(pattern))
+        if target_base is not None:
+            self._target = (target, target_base)
+
+    @property
+    def target_base(self) -> str:
+        """Target base URL ending in '/', recomputed only when it changes."""
+        target = self._target
+        src = self.target_base_url
+        if target[0] != src:
+            target = (src, normalize_target_base(src))
+            self._target = target
+        return target[1]
+
+    def _current_rule(self) -> Tuple[Optional[str], Optional[Pattern[str]], Optional[str]]:
+        """Return the (source, compiled, prefix) rule, recompiling only when source_pattern changes."""
+        rule = self._rule
+        src = self.source_pattern
+        if rule[0] != src:
+            try:
+                compiled = compile_pattern(src) if src else None
+            except re.error:
+                # Invalid regex pattern
+                compiled = None
+            rule = (src, compiled, literal_prefix(src) if compiled else None)
+            self._rule = rule
+        return rule
 
     def is_configured(self) -> bool:
         """Check if settings have been configured (not using placeholder defaults)."""
@@ -87,21 +208,15 @@ class Settings:
         Returns:
             Tuple of (rewritten_url, was_rewritten)
         """
-        if not self.source_pattern or not self.target_base_url:
+        _, pattern, prefix = self._current_rule()
+        if pattern is None or not self.target_base_url:
             return url, False
 
-        try:
-            match = re.match(self.source_pattern, url)
-            if match:
-                # Extract the captured group (item ID)
-                item_id = match.group(1)
-                # Ensure target ends with / before appending
-                target = self.target_base_url.rstrip('/') + '/'
-                new_url = f"{target}{item_id}"
-                return new_url, True
-        except re.error:
-            # Invalid regex pattern
-            pass
+        # Extract the captured group (item ID)
+        item_id = match_item_id(pattern, prefix, url)
+        if item_id is not None:
+            new_url = f"{self.target_base}{item_id}"
+            return new_url, True
 
         return url, False
 